@@ -0,0 +1,211 @@
+"""Headless benchmark of the whole dashboard against synthetic data.
+
+Drives app.py through Streamlit's AppTest. At each data scale it opens every
+page and walks its main widget states: country selection, trend estimators, the comparison
+checkbox and multiselect sizes, every scenario, and slider extremes. For each
+step it records the rerun wall time, per-section timings (load, filter,
+projection, figure) and peak memory. Results are written as JSON, so runs on
+different commits can be compared:
+
+    python benchmarks/bench_app.py --scales 2 3 4 5
+    python benchmarks/bench_app.py --scales 2 3 4 5 --compare benchmarks/results/<sha>.json
+
+Scales are powers of ten: ``--scales 7`` writes ~10^7 rows per dataset.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from climate_pulse import data, instrumentation
+from climate_pulse.figcache import figures
+from climate_pulse.pages import PAGES
+from climate_pulse.sharedcache import SQLiteBackend, results as shared_results
+from synthetic import write_datasets
+
+
+def widget(at, kind, label):
+    return next(w for w in getattr(at, kind) if w.label == label)
+
+
+def set_widget(kind, label, value):
+    return lambda at: widget(at, kind, label).set_value(value)
+
+
+def multiselect_first(n):
+    def step(at):
+        select = widget(at, "multiselect", "Select countries to compare")
+        select.set_value(select.options[:n])
+    return step
+
+
+def first_options(n):
+    def step(at):
+        select = widget(at, "selectbox", "Select a Country")
+        select.set_value(select.options[min(n, len(select.options) - 1)])
+    return step
+
+
+def all_groups(at):
+    widget(at, "multiselect", "Select regions and groups to compare").set_value(data.region_hierarchy().groups)
+
+
+# page label -> [(step name, widget change applied before the rerun)]
+STEPS = {
+    PAGES[0].label: [("open", None)],
+    PAGES[1].label: [
+        ("open", None),
+        ("second country", first_options(1)),
+        ("third country", first_options(2)),
+        ("theil-sen", set_widget("selectbox", "Trend estimator", "theil_sen")),
+        ("piecewise", set_widget("selectbox", "Trend estimator", "piecewise")),
+        ("compare", set_widget("checkbox", "Compare countries", True)),
+        ("compare 1", multiselect_first(1)),
+        ("compare 10", multiselect_first(10)),
+        ("compare 50", multiselect_first(50)),
+        ("compare all", multiselect_first(None)),
+        ("groups", set_widget("radio", "Compare", "Regions and groups")),
+        ("groups all", all_groups),
+    ],
+    PAGES[2].label: [("open", None)],
+    PAGES[3].label: [
+        ("open", None),
+        ("moderate", set_widget("radio", "Select emissions scenario", "Moderate reduction (30% cut)")),
+        ("aggressive", set_widget("radio", "Select emissions scenario", "Aggressive reduction (60% cut)")),
+        ("year 2025", set_widget("slider", "Project to year", 2025)),
+        ("year 2100", set_widget("slider", "Project to year", 2100)),
+        ("uncertainty", set_widget("checkbox", "Show uncertainty bands (Monte Carlo)", True)),
+    ],
+    PAGES[4].label: [
+        ("open", None),
+        ("meat 0", set_widget("slider", "Meat consumption", 0)),
+        ("meat 7", set_widget("slider", "Meat consumption", 7)),
+        ("car 0", set_widget("slider", "Car usage (km/week)", 0)),
+        ("car 500", set_widget("slider", "Car usage (km/week)", 500)),
+        ("renewable", set_widget("checkbox", "Do you use renewable energy at home?", True)),
+    ],
+}
+
+
+def use_data_dir(data_dir):
+    # Point the app at a new directory and drop everything cached for the old one
+    data.DATA_DIR = data_dir
+    data.live_tables.clear()
+    figures.clear()
+    # A fresh shared cache too, so each scale runs as the host's first worker
+    shared_results.backend = SQLiteBackend(os.path.join(data_dir, "results.sqlite"))
+
+
+def run_page(label, scale, trace_memory):
+    results = []
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=600)
+    at.session_state["page"] = label
+    for step, change in STEPS[label]:
+        if change is not None:
+            change(at)
+        instrumentation.totals(reset=True)
+        if trace_memory:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        at.run()
+        wall = time.perf_counter() - start
+        if at.exception:
+            raise RuntimeError(f"{label} / {step}: {at.exception[0].message}")
+        results.append({
+            "rows": 10 ** scale,
+            "page": label,
+            "step": step,
+            "wall_ms": wall * 1000,
+            "sections_ms": {name: t["seconds"] * 1000 for name, t in instrumentation.totals().items()},
+            "peak_traced_mb": tracemalloc.get_traced_memory()[1] / 2**20 if trace_memory else None,
+            "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        })
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_results(results, baseline=None):
+    previous = {}
+    if baseline is not None:
+        previous = {(r["rows"], r["page"], r["step"]): r["wall_ms"] for r in baseline["results"]}
+    sections = sorted({name for r in results for name in r["sections_ms"]})
+
+    header = f"{'rows':>9} {'page':<28} {'step':<12} {'wall ms':>9}"
+    header += "".join(f" {name[:10]:>10}" for name in sections)
+    if previous:
+        header += f" {'vs base':>8}"
+    print(header)
+    for r in results:
+        line = f"{r['rows']:>9} {r['page']:<28} {r['step']:<12} {r['wall_ms']:>9.1f}"
+        line += "".join(f" {r['sections_ms'].get(name, 0):>10.1f}" for name in sections)
+        base = previous.get((r["rows"], r["page"], r["step"]))
+        if base:
+            line += f" {r['wall_ms'] / base:>7.2f}x"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[2, 3, 4, 5],
+                        help="log10 of the rows per dataset")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="record per-step peak Python allocations (slows every step down)")
+    parser.add_argument("--output", help="JSON file to write (default: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", help="earlier results JSON to compare wall times against")
+    args = parser.parse_args()
+
+    instrumentation.enable()
+    if args.trace_memory:
+        tracemalloc.start()
+
+    results = []
+    for scale in args.scales:
+        with tempfile.TemporaryDirectory() as data_dir:
+            start = time.perf_counter()
+            write_datasets(data_dir, 10 ** scale)
+            print(f"10^{scale} rows: datasets written in {time.perf_counter() - start:.1f} s", file=sys.stderr)
+            use_data_dir(data_dir)
+            for page in PAGES:
+                results.extend(run_page(page.label, scale, args.trace_memory))
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    output = args.output or os.path.join(ROOT, "benchmarks", "results", f"{commit}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+    print(f"\nWritten to {output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
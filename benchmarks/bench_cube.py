@@ -0,0 +1,60 @@
+"""Emissions totals from raw-table groupbys versus the pre-aggregated cube.
+
+Times the totals tab2's pie chart (per country, for a growing selection) and
+tab4's projection baseline (per year) need, both ways, against a synthetic
+country-by-year table:
+
+    python benchmarks/bench_cube.py --countries 200 --years 270
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from climate_pulse.cube import EmissionsCube
+from synthetic import synthetic_co2
+from bench_emissions_index import best_of
+
+
+def share_groupby(co2_df, selected):
+    # What the pie chart did before the cube existed
+    filtered = co2_df[co2_df["Country"].isin(selected)]
+    return filtered.groupby("Country")["Emissions"].sum()
+
+
+def yearly_groupby(co2_df):
+    return co2_df.groupby("Year")["Emissions"].sum()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--countries", type=int, default=200)
+    parser.add_argument("--years", type=int, default=270)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    co2_df = synthetic_co2(args.countries, args.years)
+    start = time.perf_counter()
+    cube = EmissionsCube.from_table(co2_df)
+    build = time.perf_counter() - start
+    print(f"{len(co2_df):,} rows, cube built in {build * 1000:.1f} ms")
+
+    scan = best_of(yearly_groupby, co2_df, repeat=args.repeat)
+    cubed = best_of(cube.by_year, repeat=args.repeat)
+    print(f"yearly totals: groupby {scan * 1000:.2f} ms, cube {cubed * 1e6:.1f} µs")
+
+    print(f"{'selected':>8} {'groupby ms':>11} {'cube ms':>10} {'speedup':>8}")
+    for k in (1, 3, 10, 30, 100, args.countries):
+        if k > args.countries:
+            continue
+        selected = cube.countries[:k]
+        scan = best_of(share_groupby, co2_df, selected, repeat=args.repeat)
+        cubed = best_of(cube.by_country, selected, repeat=args.repeat)
+        print(f"{k:>8} {scan * 1000:>11.2f} {cubed * 1000:>10.3f} {scan / cubed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
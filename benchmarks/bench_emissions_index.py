@@ -0,0 +1,75 @@
+"""Per-rerun cost of the tab2 comparison view, with and without the index.
+
+Times the work tab2 does on each rerun for a growing number of selected
+countries against a synthetic country-by-year table:
+
+    python benchmarks/bench_emissions_index.py --countries 200 --years 270
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from climate_pulse.emissions_index import EmissionsIndex
+from synthetic import synthetic_co2
+
+
+def rerun_scan(co2_df, selected):
+    # The filtering tab2 did before the index existed
+    options = sorted(co2_df["Country"].unique())
+    filtered = co2_df[co2_df["Country"].isin(selected)]
+    for country in selected:
+        country_data = co2_df[co2_df["Country"] == country]
+        first_year = country_data["Year"].min()
+        last_year = country_data["Year"].max()
+        first = country_data[country_data["Year"] == first_year]["Emissions"].values[0]
+        last = country_data[country_data["Year"] == last_year]["Emissions"].values[0]
+        (last - first) / first * 100
+    return options, filtered
+
+
+def rerun_index(index, selected):
+    options = index.countries
+    filtered = index.select(selected)
+    for country in selected:
+        index.stats(country).Growth_Pct
+    return options, filtered
+
+
+def best_of(fn, *args, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--countries", type=int, default=200)
+    parser.add_argument("--years", type=int, default=270)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    co2_df = synthetic_co2(args.countries, args.years)
+    start = time.perf_counter()
+    index = EmissionsIndex(co2_df)
+    build = time.perf_counter() - start
+    print(f"{len(co2_df):,} rows, index built in {build * 1000:.1f} ms")
+
+    print(f"{'selected':>8} {'scan ms':>10} {'index ms':>10} {'speedup':>8}")
+    for k in (1, 3, 10, 30, 100, args.countries):
+        if k > args.countries:
+            continue
+        selected = index.countries[:k]
+        scan = best_of(rerun_scan, co2_df, selected, repeat=args.repeat)
+        indexed = best_of(rerun_index, index, selected, repeat=args.repeat)
+        print(f"{k:>8} {scan * 1000:>10.2f} {indexed * 1000:>10.2f} {scan / indexed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
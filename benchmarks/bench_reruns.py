@@ -0,0 +1,71 @@
+"""Rerun latency of one widget interaction per dashboard page.
+
+Drives app.py headlessly through Streamlit's AppTest, opens each page and
+times the reruns triggered by moving one of its widgets:
+
+    python benchmarks/bench_reruns.py --reruns 20
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from climate_pulse.pages import PAGES
+
+# page label -> (widget type, widget label, values to cycle through)
+INTERACTIONS = {
+    PAGES[0].label: None,
+    PAGES[1].label: ("checkbox", "Compare countries", [True, False]),
+    PAGES[2].label: None,
+    PAGES[3].label: ("slider", "Project to year", [2040, 2060, 2080, 2100]),
+    PAGES[4].label: ("slider", "Car usage (km/week)", [0, 100, 250, 500]),
+}
+
+
+def open_page(label):
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=120)
+    at.session_state["page"] = label
+    return at.run()
+
+
+def widget(at, kind, label):
+    return next(w for w in getattr(at, kind) if w.label == label)
+
+
+def time_reruns(label, reruns):
+    at = open_page(label)
+    timings = []
+    interaction = INTERACTIONS[label]
+    for i in range(reruns):
+        if interaction is not None:
+            kind, widget_label, values = interaction
+            widget(at, kind, widget_label).set_value(values[i % len(values)])
+        start = time.perf_counter()
+        at.run()
+        timings.append(time.perf_counter() - start)
+    if at.exception:
+        raise RuntimeError(f"{label}: {at.exception[0].message}")
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reruns", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'page':<30} {'median ms':>10} {'p95 ms':>10}")
+    for page in PAGES:
+        timings = sorted(time_reruns(page.label, args.reruns))
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        print(f"{page.label:<30} {statistics.median(timings) * 1000:>10.1f} {p95 * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
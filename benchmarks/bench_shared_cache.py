@@ -0,0 +1,148 @@
+"""Shared result cache: cold versus warm workers, stampedes, TTL and eviction.
+
+Starts worker processes one after another on the same synthetic data and
+SQLite cache file. The first one builds the emissions aggregates, and the
+later ones load them. Then it checks the cache's guarantees and exits
+non-zero if one fails:
+
+- concurrent misses on one key compute it once: processes against SQLite,
+  threads against the Redis stand-in;
+- entries expire after their TTL;
+- the SQLite file stays under its size cap, evicting least recently used
+  entries first.
+
+    python benchmarks/bench_shared_cache.py --scale 6 --workers 3
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from climate_pulse.ingest import LiveTables
+from climate_pulse.regions import load_hierarchy
+from climate_pulse.sharedcache import LocalRedis, RedisBackend, SharedCache, SQLiteBackend
+from synthetic import write_datasets
+
+STAMPEDE_SECONDS = 1.0  # how long the contended computation takes
+
+
+def warm_worker(data_dir, cache_path):
+    """Seconds a fresh worker takes until the co2 table and its aggregates are ready."""
+    cache = SharedCache(SQLiteBackend(cache_path)) if cache_path else None
+    tables = LiveTables(data_dir, regions=load_hierarchy(data_dir), cache=cache)
+    start = time.perf_counter()
+    tables._warm("co2", start)
+    return time.perf_counter() - start
+
+
+def _slow(path):
+    with open(path, "a") as f:
+        f.write(f"{os.getpid()}\n")
+    time.sleep(STAMPEDE_SECONDS)
+    return os.getpid()
+
+
+def stampede_worker(cache_path, log_path, start_at):
+    cache = SharedCache(SQLiteBackend(cache_path))
+    time.sleep(max(start_at - time.time(), 0))
+    return cache.get_or_compute("stampede", (), lambda: _slow(log_path))
+
+
+def check_stampede_processes(directory, workers):
+    cache_path = os.path.join(directory, "stampede.sqlite")
+    log_path = os.path.join(directory, "stampede.log")
+    start_at = time.time() + 1.0
+    with multiprocessing.get_context("spawn").Pool(workers) as pool:
+        values = pool.starmap(stampede_worker, [(cache_path, log_path, start_at)] * workers)
+    with open(log_path) as f:
+        computed = len(f.read().split())
+    print(f"stampede, {workers} processes on SQLite: computed {computed}x, {len(set(values))} distinct results")
+    return computed == 1 and len(set(values)) == 1
+
+
+def check_stampede_threads(workers):
+    cache = SharedCache(RedisBackend(LocalRedis()))
+    calls, values = [], []
+
+    def slow():
+        calls.append(threading.get_ident())
+        time.sleep(STAMPEDE_SECONDS)
+        return threading.get_ident()
+
+    threads = [threading.Thread(target=lambda: values.append(cache.get_or_compute("stampede", (), slow)))
+               for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(f"stampede, {workers} threads on the Redis stand-in: computed {len(calls)}x, "
+          f"{len(set(values))} distinct results")
+    return len(calls) == 1 and len(set(values)) == 1
+
+
+def check_ttl(backend, name):
+    cache = SharedCache(backend, ttl=0.2)
+    first = cache.get_or_compute("ttl", (), lambda: 1)
+    cached = cache.get_or_compute("ttl", (), lambda: 2)
+    time.sleep(0.3)
+    expired = cache.get_or_compute("ttl", (), lambda: 3)
+    print(f"ttl on {name}: {first}, {cached} while fresh, {expired} after expiry")
+    return (first, cached, expired) == (1, 1, 3)
+
+
+def check_eviction(directory):
+    backend = SQLiteBackend(os.path.join(directory, "evict.sqlite"), max_bytes=100_000)
+    value = b"x" * 30_000
+    backend.set("a", value, 60)
+    time.sleep(0.01)
+    backend.set("b", value, 60)
+    backend.set("c", value, 60)
+    backend.set("d", value, 60)  # over the cap: "a" is the least recently used
+    usage = backend.usage()
+    kept = [key for key in "abcd" if backend.get(key) is not None]
+    print(f"eviction on SQLite: kept {kept}, {usage['bytes']:,} of {usage['max_bytes']:,} bytes")
+    return kept == ["b", "c", "d"] and usage["bytes"] <= usage["max_bytes"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=6, help="log10 of the rows per dataset")
+    parser.add_argument("--workers", type=int, default=3)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as directory:
+        data_dir = os.path.join(directory, "data")
+        os.makedirs(data_dir)
+        write_datasets(data_dir, 10 ** args.scale)
+        cache_path = os.path.join(directory, "results.sqlite")
+
+        # Each worker is its own process, as behind the load balancer
+        with context.Pool(1) as pool:
+            pool.apply(warm_worker, (data_dir, None))  # converts the columnar store once
+        for label, path in [("no shared cache", None)] + [(f"worker {i + 1}", cache_path)
+                                                          for i in range(args.workers)]:
+            with context.Pool(1) as pool:
+                seconds = pool.apply(warm_worker, (data_dir, path))
+            print(f"10^{args.scale} rows, {label}: co2 ready in {seconds * 1000:.0f} ms")
+
+        checks = [
+            check_stampede_processes(directory, args.workers),
+            check_stampede_threads(args.workers),
+            check_ttl(SQLiteBackend(os.path.join(directory, "ttl.sqlite")), "SQLite"),
+            check_ttl(RedisBackend(LocalRedis()), "the Redis stand-in"),
+            check_eviction(directory),
+        ]
+    if not all(checks):
+        print("FAIL: a shared cache check failed", file=sys.stderr)
+    sys.exit(0 if all(checks) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Cold-start time until each dataset is ready, sequential versus concurrent.
+
+Writes synthetic datasets, then twice starts from an empty columnar store:
+once loading the datasets (and the emissions aggregates) one after another,
+once through ``LiveTables.load_async``. Prints when each dataset became
+ready, relative to the start:
+
+    python benchmarks/bench_startup.py --scale 7
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from climate_pulse import store
+from climate_pulse.ingest import LiveTables
+from synthetic import write_datasets
+
+
+def cold(data_dir):
+    # Forget every conversion and mapping, as on a freshly deployed worker
+    shutil.rmtree(os.path.join(data_dir, store.STORE_DIRNAME), ignore_errors=True)
+    store._mapped.clear()
+
+
+def sequential(data_dir):
+    tables = LiveTables(data_dir)
+    start = time.perf_counter()
+    ready = {}
+    for name in store.DATASETS:
+        tables._warm(name, start)
+        ready[name] = time.perf_counter() - start
+    return ready
+
+
+def concurrent(data_dir):
+    tables = LiveTables(data_dir)
+    start = time.perf_counter()
+    ready = {}
+    for name, future in tables.load_async().items():
+        future.add_done_callback(lambda _, name=name: ready.setdefault(name, time.perf_counter() - start))
+    for future in tables.futures.values():
+        future.result()
+    return ready
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=6, help="log10 of the rows per dataset")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        write_datasets(data_dir, 10 ** args.scale)
+        results = {}
+        for mode in (sequential, concurrent):
+            cold(data_dir)
+            results[mode.__name__] = mode(data_dir)
+
+    print(f"{'dataset':<8} {'sequential s':>13} {'concurrent s':>13}")
+    for name in store.DATASETS:
+        print(f"{name:<8} {results['sequential'][name]:>13.2f} {results['concurrent'][name]:>13.2f}")
+    print(f"{'all':<8} {max(results['sequential'].values()):>13.2f} {max(results['concurrent'].values()):>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Trend lines for every country: per-country np.polyfit versus the batched engine.
+
+Also times folding one new year into the fits incrementally, against
+rebuilding them from the whole table:
+
+    python benchmarks/bench_trends.py --countries 200 --years 270
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from climate_pulse.trends import TrendEngine
+from synthetic import synthetic_co2
+from bench_emissions_index import best_of
+
+
+def polyfit_all(co2_df):
+    # One scan and fit per country, as the country view did for a single one
+    return {
+        country: np.polyfit(part["Year"], part["Emissions"], 1)
+        for country, part in co2_df.groupby("Country", sort=False)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--countries", type=int, default=200)
+    parser.add_argument("--years", type=int, default=270)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    co2_df = synthetic_co2(args.countries, args.years)
+    last_year = co2_df["Year"].max()
+    history, new_year = co2_df[co2_df["Year"] < last_year], co2_df[co2_df["Year"] == last_year]
+    engine = TrendEngine(history)
+    print(f"{len(co2_df):,} rows")
+
+    polyfit = best_of(polyfit_all, co2_df, repeat=args.repeat)
+    batched = best_of(TrendEngine, co2_df, repeat=args.repeat)
+    print(f"fit all countries: polyfit {polyfit * 1000:.1f} ms, batched {batched * 1000:.1f} ms "
+          f"({polyfit / batched:.1f}x)")
+
+    rebuild = best_of(lambda: TrendEngine(pd.concat([history, new_year])), repeat=args.repeat)
+    extend = best_of(engine.extend, new_year, repeat=args.repeat)
+    print(f"add one year: rebuild {rebuild * 1000:.2f} ms, extend {extend * 1000:.2f} ms "
+          f"({rebuild / extend:.1f}x)")
+
+    part = co2_df[co2_df["Country"] == "USA"]
+    for method in ("theil_sen", "piecewise"):
+        start = time.perf_counter()
+        TrendEngine(part).fit("USA", method, part)
+        print(f"{method} for one country ({len(part)} points): {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Import-time budget for a fresh Streamlit worker; exits non-zero on a regression.
+
+Measures, in fresh interpreters, how long the modules app.py imports take on
+top of Streamlit itself, and checks that none of the heavy libraries the
+pages use lazily got pulled in with them. Then reports each page module's own
+cold import time, which its first render pays:
+
+    python benchmarks/check_import_time.py
+    python benchmarks/check_import_time.py --budget-ms 100 --page-budget-ms 1500
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from climate_pulse.pages import PAGES
+
+# What app.py imports before any page renders
+APP_MODULES = ["climate_pulse.admin", "climate_pulse.instrumentation", "climate_pulse.pages"]
+# Only page modules may import these
+LAZY_MODULES = ["numpy", "pandas", "plotly.express", "pyarrow"]
+DEFAULT_BUDGET_MS = 100
+
+_PROBE = """
+import importlib, json, sys, time
+import streamlit
+start = time.perf_counter()
+for name in sys.argv[1:]:
+    importlib.import_module(name)
+elapsed = time.perf_counter() - start
+print(json.dumps({"ms": elapsed * 1000, "loaded": sorted(set(sys.modules) & set(%r))}))
+""" % (LAZY_MODULES,)
+
+
+def probe(modules, repeat):
+    """Best-of-``repeat`` import time of ``modules`` in fresh interpreters."""
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.check_output([sys.executable, "-c", _PROBE, *modules], cwd=ROOT, text=True)
+        runs.append(json.loads(out.strip().splitlines()[-1]))
+    return min(runs, key=lambda r: r["ms"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="allowed import time of the app modules on top of Streamlit")
+    parser.add_argument("--page-budget-ms", type=float,
+                        help="also fail if any page module's cold import takes longer")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    failures = []
+    app = probe(APP_MODULES, args.repeat)
+    print(f"app modules: {app['ms']:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    if app["ms"] > args.budget_ms:
+        failures.append(f"app modules took {app['ms']:.1f} ms, over the {args.budget_ms:.0f} ms budget")
+    if app["loaded"]:
+        failures.append(f"app modules imported {', '.join(app['loaded'])}, which only pages may import")
+
+    for page in PAGES:
+        result = probe([f"climate_pulse.pages.{page.module}"], args.repeat)
+        print(f"page {page.module:<12} {result['ms']:>8.1f} ms")
+        if args.page_budget_ms is not None and result["ms"] > args.page_budget_ms:
+            failures.append(f"page {page.module} took {result['ms']:.1f} ms, "
+                            f"over the {args.page_budget_ms:.0f} ms budget")
+
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
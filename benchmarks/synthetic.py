@@ -0,0 +1,52 @@
+"""Synthetic datasets shaped like the ones in data/, at any size."""
+
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+REPO_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+# Country groupings and indices, copied as-is next to the synthetic tables
+LOOKUP_FILES = ["regions.csv", "vulnerability.csv"]
+
+# The dashboard's default comparison selects these, so they always exist
+NAMED_COUNTRIES = ["USA", "China", "India"]
+MAX_COUNTRIES = 200
+
+
+def country_names(n):
+    return (NAMED_COUNTRIES + [f"Country {i:03d}" for i in range(len(NAMED_COUNTRIES), n)])[:n]
+
+
+def synthetic_co2(n_countries, n_years, seed=0):
+    rng = np.random.default_rng(seed)
+    years = np.arange(2020 - n_years + 1, 2021)
+    emissions = rng.uniform(10, 1000, size=(n_countries, 1)) * rng.uniform(0.9, 1.1, size=(n_countries, n_years)).cumprod(axis=1)
+    return pd.DataFrame({
+        "Country": np.repeat(country_names(n_countries), n_years),
+        "Year": np.tile(years, n_countries),
+        "Emissions": emissions.ravel(),
+    })
+
+
+def synthetic_series(rows, column, start=1880, end=2020, scale=1.0, seed=0):
+    """An upward-trending series with noise, sampled ``rows`` times over [start, end]."""
+    rng = np.random.default_rng(seed)
+    years = np.linspace(start, end, rows)
+    trend = scale * ((years - start) / (end - start)) ** 2
+    return pd.DataFrame({"Year": years, column: trend + rng.normal(0, 0.05 * scale, rows)})
+
+
+def write_datasets(data_dir, rows, seed=0):
+    """Write co2_emissions.csv, temperature.csv and sea_level.csv with ~``rows`` rows each."""
+    os.makedirs(data_dir, exist_ok=True)
+    for name in LOOKUP_FILES:
+        shutil.copy(os.path.join(REPO_DATA_DIR, name), data_dir)
+    n_countries = int(np.clip(rows // 50, len(NAMED_COUNTRIES), MAX_COUNTRIES))
+    n_years = max(2, rows // n_countries)
+    synthetic_co2(n_countries, n_years, seed).to_csv(os.path.join(data_dir, "co2_emissions.csv"), index=False)
+    synthetic_series(rows, "Temp_Anomaly", scale=1.2, seed=seed).to_csv(
+        os.path.join(data_dir, "temperature.csv"), index=False)
+    synthetic_series(rows, "Sea_Level_Change", scale=200, seed=seed).to_csv(
+        os.path.join(data_dir, "sea_level.csv"), index=False)
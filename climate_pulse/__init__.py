@@ -0,0 +1 @@
+"""Data and computation helpers behind the Climate Pulse dashboard (app.py)."""
@@ -0,0 +1,87 @@
+"""Admin-only performance panel and metrics endpoint.
+
+Both are opt-in through the environment:
+
+- ``CLIMATE_PULSE_ADMIN_TOKEN``: open the app with ``?admin=<token>`` to get
+  a sidebar panel with rolling p50/p95 per section (process-wide and for your
+  own session), cache hit rates and table sizes.
+- ``CLIMATE_PULSE_METRICS_PORT``: serve the same metrics in Prometheus text
+  format at ``http://127.0.0.1:<port>/metrics``. With several workers on a
+  host, the first to start serves its own metrics there; the others log
+  that the port is taken and run on without the endpoint.
+
+Setting either one turns instrumentation on. With neither set, nothing is
+recorded.
+"""
+
+import hmac
+import os
+
+import streamlit as st
+
+from climate_pulse import instrumentation
+from climate_pulse.figcache import figures
+from climate_pulse.sharedcache import results
+
+ADMIN_TOKEN = os.environ.get("CLIMATE_PULSE_ADMIN_TOKEN")
+METRICS_PORT = os.environ.get("CLIMATE_PULSE_METRICS_PORT")
+
+
+def setup():
+    """Enable instrumentation and the metrics endpoint if configured."""
+    if ADMIN_TOKEN or METRICS_PORT:
+        instrumentation.enable()
+    if METRICS_PORT:
+        instrumentation.start_metrics_server(int(METRICS_PORT))
+
+
+def is_admin():
+    token = st.query_params.get("admin", "")
+    # As bytes: compare_digest rejects non-ASCII str, and any visitor picks the token
+    return bool(ADMIN_TOKEN) and hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode())
+
+
+def _stats_table(stats):
+    import pandas as pd  # only admins pay for the import
+
+    return pd.DataFrame.from_dict(stats, orient="index").rename_axis("Section").round(2)
+
+
+def render_panel():
+    """Draw the performance panel in the sidebar for admins."""
+    if not is_admin():
+        return
+
+    with st.sidebar.expander("⏱️ Performance", expanded=True):
+        st.markdown("**All sessions** (rolling p50/p95)")
+        st.dataframe(_stats_table(instrumentation.section_stats()))
+        st.markdown("**This session**")
+        st.dataframe(_stats_table(instrumentation.section_stats(session=True)))
+
+        st.markdown("**Figure cache**")
+        cache = figures.stats()
+        st.markdown(
+            f"{cache['hits']} hits / {cache['misses']} misses ({cache['hit_rate']:.0%}), "
+            f"{cache['entries']} figures, {cache['bytes'] / 2**20:.1f} of {cache['max_bytes'] / 2**20:.0f} MB"
+        )
+
+        st.markdown("**Shared result cache**")
+        if results.backend is None:
+            st.markdown("Off")
+        else:
+            shared = results.stats()
+            line = (f"{shared['hits']} hits / {shared['misses']} misses ({shared['hit_rate']:.0%}), "
+                    f"{shared['waits']} waited on another worker, {shared['errors']} errors")
+            if "entries" in shared:
+                line += (f", {shared['entries']} entries, "
+                         f"{shared['bytes'] / 2**20:.1f} of {shared['max_bytes'] / 2**20:.0f} MB")
+            st.markdown(line)
+
+        counter_values, gauge_values = instrumentation.counters()
+        rows = [
+            {"Metric": name, "Labels": ", ".join(f"{k}={v}" for k, v in labels), "Value": value}
+            for (name, labels), value in sorted({**counter_values, **gauge_values}.items())
+        ]
+        if rows:
+            st.markdown("**Counters**")
+            st.dataframe(rows, hide_index=True)
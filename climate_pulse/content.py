@@ -0,0 +1,122 @@
+"""Static page content: insight texts, milestones and action recommendations.
+
+Kept apart from the page code so it is built once, when first imported,
+instead of on every rerun.
+"""
+
+TEMPERATURE_INSIGHTS = """
+### Key Insights:
+- **Accelerating Change**: Notice the steep increase after 1950, showing how the warming rate has accelerated
+- **1.0°C Milestone**: By 2020, we crossed the critical 1.0°C warming threshold
+- **Historical Context**: The 1880-1950 period shows relatively stable temperatures compared to modern rapid warming
+- **Impact Perspective**: Even small temperature changes (0.5-1.0°C) can significantly disrupt ecosystems and weather patterns
+
+> 💡 **Did you know?** The Paris Agreement aims to limit global warming to well below 2°C, preferably 1.5°C, compared to pre-industrial levels.
+"""
+
+MILESTONES = {
+    "Milestone": ["Pre-industrial levels", "First recorded data", "Mid-century baseline", "Current warming", "Paris Agreement target", "High-risk threshold"],
+    "Temperature (°C)": [0, -0.2, 0.0, 1.0, 1.5, 2.0],
+    "Year": ["1750s", "1880", "1950", "2020", "Target", "Must avoid"],
+    "Status": ["Baseline", "Historical", "Reference", "Current", "Goal", "Danger"]
+}
+
+MILESTONE_COLORS = {"Baseline": "lightgrey", "Historical": "lightblue",
+                    "Reference": "blue", "Current": "orange",
+                    "Goal": "green", "Danger": "red"}
+
+# Country-specific insights on the emissions page
+EMISSIONS_INSIGHTS = {
+    "USA": "As one of the largest historical emitters, the USA has seen a slower growth rate recently due to a shift towards renewable energy and natural gas. However, per capita emissions remain among the highest globally.",
+    "China": "China's rapid industrialization has led to a steep increase in emissions, making it the world's largest emitter. The nation is also the leading investor in renewable energy technologies.",
+    "India": "India's emissions continue to grow with its developing economy and increasing energy demands. The country faces the challenge of balancing development needs with climate commitments."
+}
+
+DEFAULT_EMISSIONS_INSIGHT = "This country has its own unique emissions profile based on its energy mix, industrial activity, and climate policies."
+
+SEA_LEVEL_INSIGHTS = """
+### Sea Level Rise Insights:
+
+- **Accelerating Trend**: The data shows sea level rise is accelerating - notice how the curve steepens after 1950
+- **Human Impact**: The rapid rise correlates with increased industrial activity and global warming
+- **Coastal Risk**: A 160mm rise may seem small, but can significantly increase flooding frequency in coastal areas
+- **Future Projection**: Scientists predict sea levels could rise by 0.3-2.5 meters by 2100 if current trends continue
+
+#### Regional Impact Analysis
+"""
+
+# Tab label -> text for the sea level page's regional impact tabs
+SEA_LEVEL_REGIONS = {
+    "Low-lying Islands": """
+**Small Island Developing States (SIDS)**
+
+Nations like Maldives, Tuvalu, and Kiribati face existential threats from sea level rise, with some projections suggesting partial or complete submersion within decades. Many islands are already experiencing increased flooding, saltwater intrusion, and coastal erosion.
+""",
+    "Coastal Cities": """
+**Major Coastal Cities at Risk**
+
+- **Miami, USA**: Already experiences regular "sunny day flooding" during high tides
+- **Jakarta, Indonesia**: Sinking while sea levels rise, prompting plans to relocate the capital
+- **Venice, Italy**: Historic flooding becoming more frequent and severe
+- **Mumbai, India**: Densely populated low-lying areas increasingly vulnerable
+""",
+    "Delta Regions": """
+**Critical Delta Regions**
+
+The Ganges-Brahmaputra (Bangladesh), Mekong (Vietnam), and Nile (Egypt) deltas are home to millions but face severe impacts from rising seas, including:
+- Saltwater intrusion affecting agriculture
+- Loss of vital farmland
+- Displacement of communities
+- Increased vulnerability to storm surges
+""",
+}
+
+# Country-specific action recommendations
+COUNTRY_ACTIONS = {
+    "USA": {
+        "description": "As one of the highest per-capita emitters, individual actions in the USA can have significant impact.",
+        "highest_impact": "Transportation - Reducing car usage and flying less",
+        "actions": [
+            "Switch to renewable energy through your utility provider",
+            "Consider electric or hybrid vehicles for your next car purchase",
+            "Reduce beef consumption - the US has one of the highest beef consumption rates globally",
+            "Support climate policy advocacy at local and federal levels",
+            "Install home solar panels with available tax incentives"
+        ]
+    },
+    "China": {
+        "description": "China faces unique urban pollution challenges while leading in renewable energy development.",
+        "highest_impact": "Supporting clean energy transition and reducing coal dependence",
+        "actions": [
+            "Use public transportation in urban centers to reduce notorious air pollution",
+            "Support companies making verifiable sustainability commitments",
+            "Consider air purification at home to reduce health impacts of pollution",
+            "Advocate for continued investment in the country's ambitious renewable energy targets",
+            "Participate in community tree-planting initiatives in urban areas"
+        ]
+    },
+    "India": {
+        "description": "India balances development needs with climate goals while facing severe climate impacts.",
+        "highest_impact": "Water conservation and sustainable agriculture",
+        "actions": [
+            "Practice water conservation amid increasing water stress",
+            "Support farmers practicing sustainable agriculture techniques",
+            "Consider solar installations for reliable energy access",
+            "Reduce plastic waste which often ends up in waterways",
+            "Use natural cooling techniques to reduce air conditioning needs"
+        ]
+    }
+}
+
+# Default actions for countries not specifically listed
+DEFAULT_ACTIONS = {
+    "description": "Every region faces unique climate challenges that require tailored solutions.",
+    "highest_impact": "Reducing carbon footprint through daily choices",
+    "actions": [
+        "Reduce single-use plastic and support local eco-friendly businesses",
+        "Use public transport or carpool at least 3x a week",
+        "Support climate NGOs and local initiatives",
+        "Offset your carbon footprint using apps like [Wren](https://www.wren.co)",
+        "Advocate for stronger climate policies in your local government"
+    ]
+}
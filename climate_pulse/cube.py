@@ -0,0 +1,156 @@
+"""Pre-aggregated emissions totals by country, year, decade and region.
+
+Building the cube scans the CO₂ table once into a dense country-by-year grid
+and keeps each country's running (prefix) sums along the years. From those
+any question the dashboard asks is answered without touching raw rows:
+
+- totals by year, decade and continent (given a region hierarchy, see
+  ``climate_pulse.regions``) are precomputed;
+- a country's total over any span of years is two lookups in its prefix sums;
+- totals for an arbitrary subset of countries add up those lookups, one per
+  country in the subset, however many rows each country has;
+- timelines for any mix of regions, blocs and custom groups are one roll-up
+  of the prefix sums through the hierarchy's membership arrays.
+
+``extend`` folds appended rows in on the grid, without rescanning the table.
+"""
+
+import numpy as np
+import pandas as pd
+
+from climate_pulse.regions import REST_OF_WORLD
+
+
+class EmissionsCube:
+    def __init__(self, countries, years, cells, regions=None):
+        """``cells[i, j]`` is the total emissions of ``countries[i]`` in ``years[j]``.
+
+        ``regions`` is an optional ``RegionHierarchy``. Its first grouping
+        (continents in the bundled data) is precomputed as ``region_totals``.
+        """
+        self.countries = list(countries)
+        self.years = np.asarray(years)
+        self._positions = {country: i for i, country in enumerate(self.countries)}
+
+        # Prefix sums along the years, with a leading zero column so that the
+        # total over years[lo:hi] is cumulative[:, hi] - cumulative[:, lo]
+        self.cumulative = np.zeros((len(self.countries), len(self.years) + 1))
+        np.cumsum(cells, axis=1, out=self.cumulative[:, 1:])
+
+        self.year_totals = pd.Series(
+            cells.sum(axis=0), index=pd.Index(self.years, name="Year"), name="Emissions")
+        self.country_totals = pd.Series(
+            self.cumulative[:, -1], index=pd.Index(self.countries, name="Country"), name="Emissions")
+        self.decade_totals = (
+            self.year_totals.groupby(self.years // 10 * 10).sum().rename_axis("Decade"))
+
+        self.regions = regions
+        self.region_totals = None
+        if regions is not None:
+            self.region_totals = regions.rollup(
+                cells, self.countries, regions.groups_in(regions.groupings[0]), rest=REST_OF_WORLD)
+            self.region_totals = self.region_totals.rename_axis("Region").set_axis(self.years, axis=1)
+
+    @classmethod
+    def from_table(cls, co2_df, regions=None):
+        """Build the cube from a table with Country, Year and Emissions columns."""
+        country_codes, countries = pd.factorize(co2_df["Country"], sort=True)
+        year_codes, years = pd.factorize(co2_df["Year"], sort=True)
+        valid = (country_codes >= 0) & (year_codes >= 0)
+        flat = country_codes[valid] * len(years) + year_codes[valid]
+        cells = np.bincount(
+            flat,
+            weights=co2_df["Emissions"].to_numpy(dtype=float)[valid],
+            minlength=len(countries) * len(years),
+        ).reshape(len(countries), len(years))
+        return cls([str(c) for c in countries], np.asarray(years), cells, regions)
+
+    def cells(self):
+        """The country-by-year grid of totals, recovered from the prefix sums."""
+        return np.diff(self.cumulative, axis=1)
+
+    def carried_forward(self):
+        """The grid with each country's last reported value carried into later years.
+
+        A delta that appends a year for a few countries leaves every other
+        country at 0 in that year; here they keep their latest value
+        instead. The grid has no marker for absent rows, so a 0 counts as
+        unreported. Years before a country's first report stay 0.
+        """
+        cells = self.cells()
+        columns = np.arange(len(self.years))
+        last = np.maximum.accumulate(np.where(cells != 0, columns, -1), axis=1)
+        filled = np.take_along_axis(cells, np.maximum(last, 0), axis=1)
+        return np.where(last >= 0, filled, 0.0)
+
+    def extend(self, rows):
+        """A new cube over this cube's rows plus ``rows``.
+
+        Only ``rows`` is scanned; the existing totals are merged in on the grid.
+        """
+        delta = EmissionsCube.from_table(rows)
+        countries = sorted(set(self.countries) | set(delta.countries))
+        years = np.union1d(self.years, delta.years)
+        positions = {country: i for i, country in enumerate(countries)}
+
+        cells = np.zeros((len(countries), len(years)))
+        for cube in (self, delta):
+            rows_at = [positions[c] for c in cube.countries]
+            cols_at = np.searchsorted(years, cube.years)
+            cells[np.ix_(rows_at, cols_at)] += cube.cells()
+        return EmissionsCube(countries, years, cells, self.regions)
+
+    def _rows(self, countries):
+        if countries is None:
+            return slice(None), self.countries
+        countries = [c for c in countries if c in self._positions]
+        return [self._positions[c] for c in countries], countries
+
+    def _span(self, start, end):
+        lo = 0 if start is None else int(np.searchsorted(self.years, start, side="left"))
+        hi = len(self.years) if end is None else int(np.searchsorted(self.years, end, side="right"))
+        return lo, max(lo, hi)
+
+    def by_country(self, countries=None, start=None, end=None):
+        """Total per country over the years ``start`` to ``end`` (inclusive)."""
+        rows, countries = self._rows(countries)
+        lo, hi = self._span(start, end)
+        totals = self.cumulative[rows, hi] - self.cumulative[rows, lo]
+        return pd.Series(totals, index=pd.Index(countries, name="Country"), name="Emissions")
+
+    def total(self, countries=None, start=None, end=None):
+        """Total over a subset of countries and a span of years."""
+        return float(self.by_country(countries, start, end).sum())
+
+    def by_year(self, countries=None):
+        """Yearly totals over all countries, or over the subset given."""
+        if countries is None:
+            return self.year_totals
+        rows, _ = self._rows(countries)
+        running = self.cumulative[rows].sum(axis=0)
+        return pd.Series(np.diff(running), index=self.year_totals.index, name="Emissions")
+
+    def by_decade(self, countries=None):
+        """Totals per decade (1990 covers 1990-1999)."""
+        if countries is None:
+            return self.decade_totals
+        yearly = self.by_year(countries)
+        return yearly.groupby(self.years // 10 * 10).sum().rename_axis("Decade")
+
+    def by_region(self, start=None, end=None):
+        """Total per region over a span of years; None if no regions were given."""
+        if self.region_totals is None:
+            return None
+        lo, hi = self._span(start, end)
+        return self.region_totals.iloc[:, lo:hi].sum(axis=1).rename("Emissions")
+
+    def by_groups(self, groups, custom=None, rest=None):
+        """Yearly totals for groups of the region hierarchy, one row per group.
+
+        ``custom`` and ``rest`` are as for ``RegionHierarchy.rollup``. The
+        prefix sums are rolled up and differenced, which gives the same
+        totals as rolling up the yearly grid.
+        """
+        running = self.regions.rollup(self.cumulative, self.countries, groups, custom, rest)
+        return pd.DataFrame(
+            np.diff(running.to_numpy(), axis=1), index=running.index, columns=self.year_totals.index)
@@ -0,0 +1,107 @@
+"""Dataset access shared by the dashboard pages.
+
+Each page asks only for the tables it needs. All datasets start loading in
+the background, concurrently, as soon as the server's first session starts,
+and a page waits only for its own tables: the temperature page can render
+while the emissions data is still being indexed.
+"""
+
+import os
+
+import streamlit as st
+
+from climate_pulse import regions
+from climate_pulse.ingest import LiveTables
+from climate_pulse.instrumentation import gauge, timed, timed_function
+from climate_pulse.sharedcache import results
+
+# Load sample data (replace with real climate data)
+DATA_DIR = os.environ.get("CLIMATE_PULSE_DATA_DIR", "data")
+
+
+# Tables come from the memory-mapped store plus any deltas dropped into
+# data/incoming/ (see climate_pulse.ingest). One LiveTables instance is shared
+# by every session in the process; it deliberately avoids st.cache_data,
+# which would hand every rerun a private copy of the tables. The aggregates
+# built from them are shared with the other workers through the result cache.
+@st.cache_resource
+def live_tables():
+    tables = LiveTables(DATA_DIR, regions=regions.load_hierarchy(DATA_DIR), cache=results)
+    tables.load_async()
+    return tables
+
+
+def _wait(name):
+    # Block on the background load of this dataset only, with a spinner
+    future = live_tables().futures.get(name)
+    if future is not None and not future.done():
+        with st.spinner("Loading data..."), timed(f"wait.{name}"):
+            future.result()
+
+
+def _table(name):
+    _wait(name)
+    table = live_tables().table(name)
+    gauge("table_rows", len(table), table=name)
+    gauge("table_bytes", int(table.memory_usage(index=False).sum()), table=name)
+    return table
+
+
+@timed_function("load")
+def co2_table():
+    return _table("co2")
+
+
+@timed_function("load")
+def temperature_table():
+    return _table("temp")
+
+
+@timed_function("load")
+def sea_level_table():
+    return _table("sea")
+
+
+def region_hierarchy():
+    """Country groupings from data/regions.csv, or None without that file."""
+    return live_tables().regions
+
+
+@st.cache_resource
+def vulnerability():
+    """Vulnerability index per country from data/vulnerability.csv, or None."""
+    return regions.load_vulnerability(DATA_DIR)
+
+
+def table_version(name):
+    """Token that changes whenever the named dataset changes."""
+    return live_tables().version(name)
+
+
+def load_data():
+    """All three tables, loaded concurrently."""
+    futures = live_tables().load_async()
+    return tuple(futures[name].result() for name in ("co2", "temp", "sea"))
+
+
+@timed_function("load")
+def emissions_index():
+    _wait("co2")
+    return live_tables().emissions_index()
+
+
+@timed_function("load")
+def emissions_cube():
+    _wait("co2")
+    return live_tables().emissions_cube()
+
+
+@timed_function("load")
+def trends():
+    _wait("co2")
+    return live_tables().trends()
+
+
+def yearly_emissions():
+    """Total CO₂ emissions per year, as a Series indexed by Year."""
+    return emissions_cube().year_totals
@@ -0,0 +1,118 @@
+"""Server-side downsampling for long time-series charts.
+
+Charts only have a few thousand horizontal pixels, so a series is cut to a
+point budget before a figure is built. Two methods are available:
+
+- ``lttb``: Largest-Triangle-Three-Buckets. It keeps, from each bucket, the
+  point that forms the largest triangle with its neighbours, so the visual
+  shape survives.
+- ``minmax``: keeps each bucket's lowest and highest point, so spikes are
+  never lost.
+
+``downsample_frame`` caches the selected row positions per (series, range,
+budget, method). Rerunning at the same zoom level costs a dictionary lookup.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from climate_pulse.instrumentation import count
+
+# Points per series; roughly two per horizontal pixel of a wide chart
+POINT_BUDGET = 2000
+MAX_CACHED = 256
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def lttb(x, y, budget):
+    """Row positions of at most ``budget`` points chosen by LTTB."""
+    n = len(x)
+    if budget >= n or budget < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # budget - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, budget - 1).astype(int)
+    selected = np.empty(budget, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(budget - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x = x[end:edges[i + 2]].mean()
+            next_y = y[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        area = np.abs((x[a] - next_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (next_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def minmax(x, y, budget):
+    """Row positions of each bucket's minimum and maximum (at most ``budget``)."""
+    n = len(x)
+    if budget >= n or budget < 4:
+        return np.arange(n)
+    y = np.asarray(y, dtype=float)
+    # Leave room for the first and last points, which are always kept
+    bucket = np.arange(n) * ((budget - 2) // 2) // n
+    order = np.lexsort((y, bucket))
+    boundaries = np.flatnonzero(np.diff(bucket[order])) + 1
+    lows = order[np.concatenate(([0], boundaries))]
+    highs = order[np.concatenate((boundaries - 1, [n - 1]))]
+    return np.unique(np.concatenate(([0, n - 1], lows, highs)))
+
+
+METHODS = {"lttb": lttb, "minmax": minmax}
+
+
+def _positions(df, x, y, budget, x_range, group, method):
+    xs = df[x].to_numpy()
+    ys = df[y].to_numpy()
+    rows = np.arange(len(df))
+    if x_range is not None:
+        rows = np.flatnonzero((xs >= x_range[0]) & (xs <= x_range[1]))
+
+    if group is None:
+        groups = [rows]
+    else:
+        codes = df[group].factorize()[0][rows]
+        order = np.argsort(codes, kind="stable")
+        rows = rows[order]
+        groups = np.split(rows, np.flatnonzero(np.diff(codes[order])) + 1)
+
+    picked = [series[METHODS[method](xs[series], ys[series], budget)] for series in groups if len(series)]
+    return np.concatenate(picked) if picked else rows[:0]
+
+
+def downsample_frame(df, x, y, key=None, budget=POINT_BUDGET, x_range=None, group=None, method="lttb"):
+    """Rows of ``df`` reduced to ``budget`` points per series.
+
+    ``x`` must be sorted within each series. ``group`` names the column that
+    splits ``df`` into series, as ``color=`` does in plotly express.
+    ``x_range`` limits the result to a zoomed window, which is then resolved
+    at full budget. Pass a hashable ``key`` that changes with the data (e.g.
+    dataset name and version) to cache the selection.
+    """
+    if key is None:
+        return df.iloc[_positions(df, x, y, budget, x_range, group, method)]
+
+    cache_key = (key, x, y, budget, None if x_range is None else tuple(x_range), group, method)
+    with _cache_lock:
+        positions = _cache.get(cache_key)
+        if positions is not None:
+            _cache.move_to_end(cache_key)
+    count("cache_hits_total" if positions is not None else "cache_misses_total", cache="downsample")
+    if positions is None:
+        positions = _positions(df, x, y, budget, x_range, group, method)
+        with _cache_lock:
+            _cache[cache_key] = positions
+            while len(_cache) > MAX_CACHED:
+                _cache.popitem(last=False)
+    return df.iloc[positions]
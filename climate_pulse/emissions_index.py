@@ -0,0 +1,142 @@
+"""Per-country index over the CO₂ emissions table.
+
+Building the index sorts the table once by (Country, Year), so each
+country's rows form one contiguous slice. The columnar store already keeps
+the CO₂ table in that order; a table that is sorted is used as it is, so the
+index over the memory-mapped table holds no copy of its rows. It also
+precomputes the per-country summary the dashboard shows (first/last year and
+emissions, growth and average annual change). After that, looking up a country is a dictionary
+lookup plus a slice, not a scan over the whole table. ``extend`` adds
+appended rows without re-sorting the countries they don't touch.
+
+A pickled index (as kept in the shared result cache) holds the summary and
+slice bounds but not the rows; ``attach`` gives it back the table it was
+built from.
+"""
+
+import numpy as np
+import pandas as pd
+
+from climate_pulse.store import concat_tables
+
+
+class EmissionsIndex:
+    def __init__(self, co2_df, presorted=False):
+        if not presorted:
+            co2_df = _sorted(co2_df)
+
+        self.frame = co2_df
+        codes, countries = pd.factorize(co2_df["Country"], sort=True)
+        self.countries = [str(c) for c in countries]
+
+        starts = np.searchsorted(codes, np.arange(len(countries)), side="left")
+        ends = np.searchsorted(codes, np.arange(len(countries)), side="right")
+        self._slices = {
+            country: (int(start), int(end))
+            for country, start, end in zip(self.countries, starts, ends)
+        }
+
+        years = self.frame["Year"].to_numpy()
+        emissions = self.frame["Emissions"].to_numpy()
+        self.summary = _summarize(self.countries, years, emissions, starts, ends)
+        self._stats = dict(zip(self.countries, self.summary.itertuples()))
+
+    def __contains__(self, country):
+        return country in self._slices
+
+    def __getstate__(self):
+        # Pickled for the shared result cache: the rows stay in the table
+        # they came from, and itertuples rows don't pickle
+        state = self.__dict__.copy()
+        del state["frame"], state["_stats"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.frame = None
+        self._stats = dict(zip(self.countries, self.summary.itertuples()))
+
+    def attach(self, co2_df):
+        """Give an unpickled index the table it was built from; returns the index.
+
+        A sorted table (such as the memory-mapped one) is used as it is.
+        """
+        if self.frame is None:
+            self.frame = _sorted(co2_df)
+        return self
+
+    def country_data(self, country):
+        """Rows for one country, ordered by year."""
+        start, end = self._slices.get(country, (0, 0))
+        return self.frame.iloc[start:end]
+
+    def select(self, countries):
+        """Rows for several countries, grouped in the order given."""
+        positions = [np.arange(*self._slices[c]) for c in countries if c in self._slices]
+        if not positions:
+            return self.frame.iloc[0:0]
+        return self.frame.take(np.concatenate(positions))
+
+    def extend(self, rows):
+        """A new index over this index's rows plus ``rows``.
+
+        Countries that ``rows`` doesn't touch keep their already sorted
+        segments, so only the touched countries are re-sorted.
+        """
+        touched = {
+            str(country): part
+            for country, part in rows.groupby("Country", observed=True, sort=False)
+        }
+        segments = []
+        for country in sorted(set(self.countries) | set(touched)):
+            segment = self.country_data(country)
+            if country in touched:
+                segment = concat_tables([segment, touched[country]]).sort_values("Year", kind="stable")
+            segments.append(segment)
+        return EmissionsIndex(concat_tables(segments), presorted=True)
+
+    def stats(self, country):
+        """Summary row (see ``summary``) for one country, as a named tuple."""
+        return self._stats[country]
+
+
+def _sorted(co2_df):
+    if _is_sorted(co2_df):
+        return co2_df
+    codes, _ = pd.factorize(co2_df["Country"], sort=True)
+    order = np.lexsort((co2_df["Year"].to_numpy(), codes))
+    return co2_df.take(order).reset_index(drop=True)
+
+
+def _is_sorted(co2_df):
+    # One pass over the codes instead of a sort and a copy of every column
+    codes, _ = pd.factorize(co2_df["Country"], sort=True)
+    years = co2_df["Year"].to_numpy()
+    same_country = codes[1:] == codes[:-1]
+    return bool(np.all(codes[1:] >= codes[:-1]) and np.all(years[1:][same_country] >= years[:-1][same_country]))
+
+
+def _summarize(countries, years, emissions, starts, ends):
+    last = ends - 1
+    first_year = years[starts]
+    last_year = years[last]
+    first_emissions = emissions[starts].astype(float)
+    last_emissions = emissions[last].astype(float)
+    span = (last_year - first_year).astype(float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth_pct = (last_emissions - first_emissions) / first_emissions * 100
+        avg_annual_change = (last_emissions - first_emissions) / span
+
+    return pd.DataFrame(
+        {
+            "Rows": ends - starts,
+            "First_Year": first_year,
+            "Last_Year": last_year,
+            "First_Emissions": first_emissions,
+            "Last_Emissions": last_emissions,
+            "Growth_Pct": growth_pct,
+            "Avg_Annual_Change": avg_annual_change,
+        },
+        index=pd.Index(countries, name="Country"),
+    )
@@ -0,0 +1,81 @@
+"""Process-wide cache of built Plotly figures.
+
+Many sessions ask for the same few views, so figures are cached on the exact
+inputs that determine them (dataset version, countries, scenario, year, ...)
+and shared by every session in the process. Entries are evicted least
+recently used first once their serialized size passes the memory cap.
+
+Cached figures are shared: callers must not modify a figure they got from
+the cache.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+from climate_pulse.instrumentation import count, timed
+
+DEFAULT_MAX_BYTES = int(os.environ.get("CLIMATE_PULSE_FIGURE_CACHE_MB", "64")) * 1024 * 1024
+
+
+class FigureCache:
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (figure, size in bytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_build(self, key, build):
+        """Return the cached figure for ``key``, calling ``build()`` on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                count("cache_hits_total", cache="figures")
+                return entry[0]
+            self.misses += 1
+        count("cache_misses_total", cache="figures")
+
+        with timed("figure"):
+            figure = build()
+        size = len(figure.to_json())
+        with self._lock:
+            if key not in self._entries and size <= self.max_bytes:
+                self._entries[key] = (figure, size)
+                self._bytes += size
+                while self._bytes > self.max_bytes:
+                    _, (_, evicted) = self._entries.popitem(last=False)
+                    self._bytes -= evicted
+                    self.evictions += 1
+        return figure
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """Hit/miss counters and current occupancy, for tuning the cap."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+figures = FigureCache()
+
+
+def cached_figure(key, build):
+    """Shortcut for ``figures.get_or_build(key, build)``."""
+    return figures.get_or_build(key, build)
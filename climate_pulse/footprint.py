@@ -0,0 +1,133 @@
+"""Carbon-footprint model behind the Personalized Action calculator.
+
+``score_footprints`` scores any number of people at once. It takes a
+DataFrame with one row per person and these columns:
+
+- ``flights``: flights per year
+- ``meat_days``: days per week with meat
+- ``car_km_per_week``: kilometres driven per week
+- ``renewable_energy``: whether the home runs on renewable energy
+  (bool, 0/1, or yes/no/true/false)
+- ``country``: used to compare against the country average
+
+The model is the same simplified one the dashboard has always used.
+``score_person`` scores one person for the calculator and keeps the result in
+the shared result cache, since the same few answers come up again and again.
+Large files can be scored without loading them whole:
+
+    python -m climate_pulse.footprint survey.csv scores.csv --chunksize 100000
+"""
+
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+
+from climate_pulse.sharedcache import PAGE_LEASE, results
+
+# Very simplified model, in tonnes CO2e per year
+FLIGHT_TONNES = 0.7  # per flight
+MEAT_DAY_TONNES = 0.3  # per weekly meat day
+CAR_KM_TONNES = 0.0002  # per km
+WEEKS_PER_YEAR = 52
+HOME_ENERGY_TONNES = 2.0
+RENEWABLE_FACTOR = 0.4  # share of home energy emissions left with renewables
+
+COUNTRY_AVERAGES = {"USA": 15.5, "China": 7.4, "India": 1.9}
+GLOBAL_AVERAGE = 4.8  # fallback for countries without their own average
+
+INPUT_COLUMNS = ["flights", "meat_days", "car_km_per_week", "renewable_energy", "country"]
+SCORE_COLUMNS = ["flight_footprint", "meat_footprint", "car_footprint", "home_energy",
+                 "total_footprint", "country_average", "comparison_pct"]
+
+_TRUE_STRINGS = {"1", "true", "yes", "y", "t"}
+
+
+def _as_bool(values):
+    if values.dtype == bool:
+        return values.to_numpy()
+    if values.dtype.kind in "iuf":
+        return values.fillna(0).to_numpy() != 0
+    return values.astype(str).str.strip().str.lower().isin(_TRUE_STRINGS).to_numpy()
+
+
+def score_footprints(df):
+    """Score every row of ``df``; returns the score columns, aligned to ``df``.
+
+    ``comparison_pct`` is how far each footprint lies above (positive) or
+    below (negative) the average for that row's country. Raises ValueError
+    if an input column is missing.
+    """
+    missing = [column for column in INPUT_COLUMNS if column not in df.columns]
+    if missing:
+        raise ValueError(f"missing input columns: {', '.join(missing)}")
+
+    flight = df["flights"].to_numpy(dtype=float) * FLIGHT_TONNES
+    meat = df["meat_days"].to_numpy(dtype=float) * MEAT_DAY_TONNES
+    car = df["car_km_per_week"].to_numpy(dtype=float) * CAR_KM_TONNES * WEEKS_PER_YEAR
+    home = HOME_ENERGY_TONNES * np.where(_as_bool(df["renewable_energy"]), RENEWABLE_FACTOR, 1.0)
+    total = flight + meat + car + home
+
+    # Lookup against the per-country averages. A chunk whose countries are
+    # all blank (or numbers) is read as floats, so the key is cast first.
+    averages = (
+        df["country"].astype("string")
+        .map(COUNTRY_AVERAGES)
+        .astype(float)
+        .fillna(GLOBAL_AVERAGE)
+        .to_numpy()
+    )
+
+    return pd.DataFrame({
+        "flight_footprint": flight,
+        "meat_footprint": meat,
+        "car_footprint": car,
+        "home_energy": home,
+        "total_footprint": total,
+        "country_average": averages,
+        "comparison_pct": (total / averages - 1) * 100,
+    }, index=df.index)
+
+
+def score_person(flights, meat_days, car_km_per_week, renewable_energy, country):
+    """Scores for one person, as a dict keyed by ``SCORE_COLUMNS``."""
+    person = (float(flights), float(meat_days), float(car_km_per_week), bool(renewable_energy), str(country))
+
+    def score():
+        df = pd.DataFrame([person], columns=INPUT_COLUMNS)
+        return {column: float(value) for column, value in score_footprints(df).iloc[0].items()}
+
+    return results.get_or_compute("footprint", person, score, lease=PAGE_LEASE)
+
+
+def score_csv(source, destination, chunksize=100_000):
+    """Stream ``source`` through the model in chunks, appending scores to ``destination``.
+
+    Input columns are passed through, and the score columns are added after
+    them. Returns the number of rows scored.
+    """
+    rows = 0
+    for i, chunk in enumerate(pd.read_csv(source, chunksize=chunksize)):
+        scored = pd.concat([chunk, score_footprints(chunk)], axis=1)
+        scored.to_csv(destination, mode="w" if i == 0 else "a", header=i == 0, index=False)
+        rows += len(chunk)
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score carbon footprints for every row of a CSV.")
+    parser.add_argument("source", help=f"input CSV with columns {', '.join(INPUT_COLUMNS)}")
+    parser.add_argument("destination", help="output CSV (input columns plus scores)")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="rows per chunk")
+    args = parser.parse_args(argv)
+
+    try:
+        rows = score_csv(args.source, args.destination, args.chunksize)
+    except ValueError as error:
+        parser.error(f"{args.source}: {error}")
+    print(f"Scored {rows:,} rows -> {args.destination}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
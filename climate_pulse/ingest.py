@@ -0,0 +1,256 @@
+"""Append-only ingestion of new rows from a drop folder.
+
+Delta CSVs dropped into ``<data_dir>/incoming/`` are appended to the dataset
+whose file name they start with. For example, ``co2_emissions-2021.csv`` is
+appended to ``co2_emissions.csv``. A delta must have the same columns as its
+dataset and contain only new rows. Deltas are applied in file-name order,
+once each. Write them under a temporary name and rename them into place, and
+never edit one after it has been dropped. A delta that can't be read, lacks
+a column, has empty or non-numeric values where numbers belong, or repeats a
+row key (``KEY_COLUMNS``, e.g. a country's year) that the delta or the
+dataset already has is rejected: it is logged, skipped until the file
+changes, and the dataset keeps serving its last good table.
+
+``LiveTables`` holds each dataset as its memory-mapped base table plus the
+deltas applied so far. It polls the drop folder at most once every
+``POLL_INTERVAL`` seconds, on access, so live sessions pick up new rows on
+their next rerun. Each new delta is merged into the in-memory table, and the
+aggregates derived from it are updated in place of being rebuilt: the
+emissions index only re-sorts the countries the delta touches, and the
+emissions cube adds the delta's totals to its grid, and the trend engine adds
+the delta's sufficient statistics to its fits.
+
+The first delta costs memory: merging it copies the memory-mapped base table
+into the worker's own memory, and the emissions index keeps a second, sorted
+copy of the CO₂ rows. From then on the worker no longer shares the base
+table's pages with the others, so fold deltas into the base CSV regularly on
+large datasets.
+
+Datasets are independent of each other: each has its own lock, so one can
+be loaded, or have a delta applied, while another is read. ``load_async``
+loads them concurrently on a thread pool and returns a future per dataset;
+the server calls it once at startup to warm everything in the background.
+
+Every applied delta bumps the dataset's ``version``. Downstream caches key
+on that version, so they invalidate only the dataset that changed. Given a
+shared result cache (``climate_pulse.sharedcache``), an aggregate's first
+build goes through it, keyed on the dataset version and the deltas in it:
+the first worker to need it builds it, and the others load that copy. Delta
+files are never moved or deleted. Every worker process applies them for
+itself. Fold them into the base CSV, and remove them, when convenient. A
+base CSV change re-applies whatever deltas are still in the folder.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from climate_pulse import store
+from climate_pulse.cube import EmissionsCube
+from climate_pulse.emissions_index import EmissionsIndex
+from climate_pulse.instrumentation import count, gauge, timed
+from climate_pulse.trends import TrendEngine
+
+logger = logging.getLogger(__name__)
+
+INCOMING_DIRNAME = "incoming"
+# Columns that identify a row; a delta may not repeat a key already present
+KEY_COLUMNS = {"co2": ["Country", "Year"], "temp": ["Year"], "sea": ["Year"]}
+POLL_INTERVAL = 2.0  # seconds
+
+
+class _Dataset:
+    def __init__(self, base_version, table):
+        self.base_version = base_version
+        self.table = table
+        self.applied = []  # file names of applied deltas, in order
+        self.rejected = {}  # file name -> (size, mtime) of deltas that failed to apply
+        self.aggregates = {}  # key -> (value, update function)
+
+    @property
+    def version(self):
+        return f"{self.base_version}.{len(self.applied)}"
+
+
+class LiveTables:
+    def __init__(self, data_dir, poll_interval=POLL_INTERVAL, regions=None, cache=None):
+        self.data_dir = data_dir
+        self.regions = regions
+        self.cache = cache  # SharedCache for aggregate builds, or None
+        self.incoming_dir = os.path.join(data_dir, INCOMING_DIRNAME)
+        self.poll_interval = poll_interval
+        self._datasets = {}
+        self._last_poll = {}
+        self._locks = defaultdict(threading.RLock)  # dataset name -> lock
+        self._locks_lock = threading.Lock()
+        self._executor = None
+        self.futures = {}  # dataset name -> future from the latest load_async
+
+    def _lock(self, name):
+        with self._locks_lock:
+            return self._locks[name]
+
+    def table(self, name):
+        """Current table for a dataset: base rows plus all applied deltas."""
+        return self._refresh(name).table
+
+    def version(self, name):
+        """Version token that changes with the base file and with every delta."""
+        return self._refresh(name).version
+
+    def aggregate(self, name, key, build, update, attach=None):
+        """A derived value kept current as deltas arrive.
+
+        ``build(table)`` computes it from scratch the first time.
+        ``update(value, rows)`` folds one delta's rows into it afterwards.
+        ``key`` must identify the build, as it also addresses the shared
+        cache. A value that leaves the table out of its pickled state gets
+        it back through ``attach(value, table)``.
+        """
+        dataset = self._refresh(name)
+        with self._lock(name):
+            if key not in dataset.aggregates:
+                value = (
+                    build(dataset.table) if self.cache is None else self.cache.get_or_compute(
+                        "aggregate", (name, key, dataset.version, tuple(dataset.applied)),
+                        lambda: build(dataset.table))
+                )
+                if attach is not None:
+                    value = attach(value, dataset.table)
+                dataset.aggregates[key] = (value, update)
+            return dataset.aggregates[key][0]
+
+    def emissions_index(self):
+        return self.aggregate("co2", "index", EmissionsIndex, EmissionsIndex.extend, EmissionsIndex.attach)
+
+    def emissions_cube(self):
+        build = lambda table: EmissionsCube.from_table(table, self.regions)
+        key = ("cube", self.regions.digest if self.regions is not None else None)
+        return self.aggregate("co2", key, build, EmissionsCube.extend)
+
+    def trends(self):
+        return self.aggregate("co2", "trends", TrendEngine, TrendEngine.extend)
+
+    def load_async(self, names=None):
+        """Start loading datasets on a thread pool; returns ``{name: Future}``.
+
+        Each future resolves to the dataset's table once the table and its
+        aggregates are built. Reading a dataset meanwhile waits for that
+        dataset only. Time from the call until each dataset is ready is
+        reported as the ``startup_ready_seconds`` gauge.
+        """
+        started = time.perf_counter()
+        with self._locks_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(len(store.DATASETS), thread_name_prefix="load")
+        futures = {
+            name: self._executor.submit(self._warm, name, started)
+            for name in (names or store.DATASETS)
+        }
+        self.futures.update(futures)
+        return futures
+
+    def _warm(self, name, started):
+        with timed(f"warm.{name}"):
+            table = self.table(name)
+            if name == "co2":
+                self.emissions_index()
+                self.emissions_cube()
+                self.trends()
+        gauge("startup_ready_seconds", time.perf_counter() - started, dataset=name)
+        return table
+
+    def _refresh(self, name):
+        with self._lock(name):
+            dataset = self._datasets.get(name)
+            now = time.monotonic()
+            if dataset is not None and now - self._last_poll.get(name, 0) < self.poll_interval:
+                return dataset
+            self._last_poll[name] = now
+
+            base_version = store.source_version(self.data_dir, name)
+            if dataset is None or dataset.base_version != base_version:
+                dataset = _Dataset(base_version, store.load_table(self.data_dir, name))
+                self._datasets[name] = dataset
+
+            for delta in self._pending(name, dataset):
+                self._apply(name, dataset, delta)
+            return dataset
+
+    def _pending(self, name, dataset):
+        prefix = os.path.splitext(store.DATASETS[name])[0]
+        try:
+            entries = sorted(os.scandir(self.incoming_dir), key=lambda e: e.name)
+        except FileNotFoundError:
+            return []
+        applied = set(dataset.applied)
+        pending = []
+        for entry in entries:
+            if not (entry.name.startswith(prefix) and entry.name.endswith(".csv")) or entry.name in applied:
+                continue
+            # A rejected delta is retried only once its file has been replaced
+            if entry.name in dataset.rejected and dataset.rejected[entry.name] == _signature(entry.path):
+                continue
+            pending.append(entry.name)
+        return pending
+
+    def _apply(self, name, dataset, delta):
+        path = os.path.join(self.incoming_dir, delta)
+        try:
+            rows = _read_delta(path, dataset.table, KEY_COLUMNS[name])
+            # Copies the mapped base table into this worker (see the module docstring)
+            table = store.concat_tables([dataset.table, rows])
+            aggregates = {
+                key: (update(value, rows), update) for key, (value, update) in dataset.aggregates.items()
+            }
+        except Exception as error:
+            # Keep serving the last good table; don't retry this file every poll
+            logger.warning("Rejected delta %s for %s: %s", path, name, error)
+            count("deltas_rejected_total", dataset=name)
+            dataset.rejected[delta] = _signature(path)
+            return
+        dataset.table = table
+        dataset.aggregates = aggregates
+        dataset.applied.append(delta)
+        dataset.rejected.pop(delta, None)
+
+
+def _signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _read_delta(path, table, keys):
+    """A delta's rows, in the table's columns, or ValueError if it doesn't fit."""
+    rows = pd.read_csv(path)
+    missing = [column for column in table.columns if column not in rows.columns]
+    if missing:
+        raise ValueError(f"missing columns {', '.join(missing)}")
+    rows = rows[list(table.columns)]
+    if rows.isna().any().any():
+        raise ValueError("empty values (is the file complete?)")
+    for column, dtype in table.dtypes.items():
+        if dtype.kind in "biuf":
+            rows[column] = pd.to_numeric(rows[column])
+    _check_new_keys(rows, table, keys)
+    return rows
+
+
+def _check_new_keys(rows, table, keys):
+    # Repeated rows would be counted twice by every aggregate
+    if rows.duplicated(keys).any():
+        raise ValueError(f"repeated {', '.join(keys)} within the delta")
+    # Only the table rows in the delta's years can clash
+    candidates = table.loc[table["Year"].isin(rows["Year"]), keys].astype(object)
+    clashes = rows[keys].astype(object).merge(candidates, on=keys)
+    if len(clashes):
+        example = ", ".join(str(v) for v in clashes.iloc[0])
+        raise ValueError(f"{len(clashes)} rows already present (e.g. {example})")
@@ -0,0 +1,227 @@
+"""Section timings and counters for the dashboard's hot paths.
+
+Code marks its sections with ``timed("name")`` (a context manager) or
+``timed_function("name")`` (a decorator), counts events with ``count`` and
+reports sizes with ``gauge``. Instrumentation is off unless
+``CLIMATE_PULSE_TIMINGS=1`` is set or ``enable()`` is called. When it is
+off, every call reduces to a flag check.
+
+Each section keeps the last ``ROLLING_WINDOW`` durations, both process-wide
+and per Streamlit session, for p50/p95 reporting. ``prometheus_text`` renders
+everything in the Prometheus text exposition format, and
+``start_metrics_server`` serves it on a local port.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from statistics import quantiles
+
+logger = logging.getLogger(__name__)
+
+ROLLING_WINDOW = 1000
+MAX_SESSIONS = 256  # sessions with their own rolling windows, most recent first
+METRIC_PREFIX = "climate_pulse"
+
+_enabled = os.environ.get("CLIMATE_PULSE_TIMINGS") == "1"
+_lock = threading.Lock()
+_NOOP = nullcontext()
+
+_totals = defaultdict(lambda: [0, 0.0])  # section -> [calls, seconds] since the last reset
+_rolling = defaultdict(lambda: deque(maxlen=ROLLING_WINDOW))  # section -> recent durations
+_session_rolling = OrderedDict()  # session id -> {section -> recent durations}
+_lifetime = defaultdict(lambda: [0, 0.0])  # section -> [calls, seconds] since start
+_counters = defaultdict(int)  # (name, labels) -> value
+_gauges = {}  # (name, labels) -> value
+
+_server = None
+_server_attempted = False
+
+
+def enable(on=True):
+    global _enabled
+    _enabled = on
+
+
+def enabled():
+    return _enabled
+
+
+def _session_id():
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return None
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.session_id if ctx is not None else None
+
+
+def record(section, seconds):
+    session = _session_id()
+    with _lock:
+        _totals[section][0] += 1
+        _totals[section][1] += seconds
+        _rolling[section].append(seconds)
+        _lifetime[section][0] += 1
+        _lifetime[section][1] += seconds
+        if session is not None:
+            if session not in _session_rolling:
+                _session_rolling[session] = defaultdict(lambda: deque(maxlen=ROLLING_WINDOW))
+                if len(_session_rolling) > MAX_SESSIONS:
+                    _session_rolling.popitem(last=False)
+            _session_rolling.move_to_end(session)
+            _session_rolling[session][section].append(seconds)
+
+
+def count(name, n=1, **labels):
+    """Add ``n`` to a counter, e.g. ``count("cache_hits_total", cache="figures")``."""
+    if _enabled:
+        with _lock:
+            _counters[name, tuple(sorted(labels.items()))] += n
+
+
+def gauge(name, value, **labels):
+    """Set a gauge, e.g. ``gauge("table_rows", len(df), table="co2")``."""
+    if _enabled:
+        with _lock:
+            _gauges[name, tuple(sorted(labels.items()))] = value
+
+
+@contextmanager
+def _timing(section):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(section, time.perf_counter() - start)
+
+
+def timed(section):
+    """Context manager recording how long its block takes under ``section``."""
+    return _timing(section) if _enabled else _NOOP
+
+
+def timed_function(section):
+    """Decorator recording each call's duration under ``section``."""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _timing(section):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def totals(reset=False):
+    """Total seconds and call count per section since the last reset."""
+    with _lock:
+        result = {section: {"seconds": seconds, "calls": calls}
+                  for section, (calls, seconds) in _totals.items()}
+        if reset:
+            _totals.clear()
+    return result
+
+
+def _p50_p95(durations):
+    # Pure Python, so that importing this module never pulls in numpy
+    if len(durations) < 2:
+        return (durations[0],) * 2 if durations else (0.0, 0.0)
+    cuts = quantiles(durations, n=20, method="inclusive")  # 5% steps
+    return cuts[9], cuts[18]
+
+
+def _percentiles(durations):
+    p50, p95 = _p50_p95(durations)
+    return {"calls": len(durations), "p50_ms": p50 * 1000, "p95_ms": p95 * 1000}
+
+
+def section_stats(session=False):
+    """Rolling p50/p95 per section, for the whole process or the current session."""
+    with _lock:
+        if session:
+            windows = _session_rolling.get(_session_id(), {})
+        else:
+            windows = _rolling
+        windows = {section: list(d) for section, d in windows.items()}
+    return {section: _percentiles(d) for section, d in sorted(windows.items())}
+
+
+def counters():
+    with _lock:
+        return dict(_counters), dict(_gauges)
+
+
+def _labels(pairs):
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+
+def prometheus_text():
+    """All metrics in the Prometheus text exposition format."""
+    with _lock:
+        rolling = {section: list(d) for section, d in _rolling.items()}
+        lifetime = {section: tuple(v) for section, v in _lifetime.items()}
+        counter_values = dict(_counters)
+        gauge_values = dict(_gauges)
+
+    name = f"{METRIC_PREFIX}_section_seconds"
+    lines = [f"# HELP {name} Time spent in instrumented sections.", f"# TYPE {name} summary"]
+    for section in sorted(rolling):
+        for quantile, value in zip(("0.5", "0.95"), _p50_p95(rolling[section])):
+            lines.append(f'{name}{{section="{section}",quantile="{quantile}"}} {value:.6f}')
+        calls, seconds = lifetime[section]
+        lines.append(f'{name}_sum{{section="{section}"}} {seconds:.6f}')
+        lines.append(f'{name}_count{{section="{section}"}} {calls}')
+
+    for kind, values in (("counter", counter_values), ("gauge", gauge_values)):
+        for metric in sorted({metric for metric, _ in values}):
+            full = f"{METRIC_PREFIX}_{metric}"
+            lines.append(f"# TYPE {full} {kind}")
+            for (m, labels), value in sorted(values.items()):
+                if m == metric:
+                    lines.append(f"{full}{_labels(labels)} {value}")
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = prometheus_text().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(port, host="127.0.0.1"):
+    """Serve ``/metrics`` on a background thread; later calls are no-ops.
+
+    Only the first call tries to bind. If the port is taken (with several
+    workers on a host, the first one gets it), that is logged once and
+    None is returned; the app runs on without the endpoint.
+    """
+    global _server, _server_attempted
+    with _lock:
+        if not _server_attempted:
+            _server_attempted = True
+            try:
+                _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            except OSError as error:
+                logger.warning("Metrics server not started on %s:%s: %s", host, port, error)
+            else:
+                threading.Thread(target=_server.serve_forever, name="metrics", daemon=True).start()
+    return _server
@@ -0,0 +1,168 @@
+"""Monte Carlo uncertainty bands for the What-If projections.
+
+Each sampled trajectory draws its own annual rate, initial cut and climate
+sensitivity around a scenario's parameters. Samples are generated in
+vectorized chunks and the chunks are spread over a process pool. Each chunk
+reduces its trajectories to percentiles straight away, so memory stays
+bounded however many samples are requested. The band estimate is the
+chunk-size-weighted mean of the chunk percentiles. ``simulate`` yields an
+updated estimate as each chunk finishes, so the page can redraw while the
+rest are still running. If a pool worker dies (killed for memory, say), the
+remaining chunks run in this process and the next call starts a new pool.
+
+Chunks are seeded from ``np.random.SeedSequence(seed).spawn``. The final
+bands depend only on (scenario, uncertainty, samples, seed) and are cached
+under that key, in this process and in the shared result cache.
+"""
+
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import NamedTuple
+
+import numpy as np
+
+from climate_pulse.projections import SEA_OFFSET, TEMP_OFFSET, ScenarioParams
+from climate_pulse.sharedcache import results
+
+PERCENTILES = (5, 50, 95)
+CHUNK_SIZE = 10_000
+MAX_CACHED = 32
+
+
+class Uncertainty(NamedTuple):
+    rate_sd: float = 0.01  # absolute standard deviation of the annual rate
+    cut_sd: float = 0.05  # absolute standard deviation of the initial cut
+    sensitivity_sd: float = 0.25  # lognormal sigma of the climate sensitivity
+
+
+class Bands(NamedTuple):
+    years: np.ndarray  # (years,)
+    emissions: np.ndarray  # (len(PERCENTILES), years)
+    temperature: np.ndarray
+    sea_level: np.ndarray
+    samples: int  # trajectories the estimate is based on so far
+    complete: bool
+
+
+_results = OrderedDict()
+_results_lock = threading.Lock()
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _pool():
+    # One pool per process, reused across reruns. "spawn" keeps the workers
+    # independent of the server's threads.
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+        return _executor
+
+
+def _discard_pool(pool):
+    # A broken pool refuses all work; drop it unless another call already has
+    global _executor
+    with _executor_lock:
+        if _executor is pool:
+            _executor = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _simulate_chunk(params, uncertainty, latest_total, latest_year, end_year, samples, seed):
+    rng = np.random.default_rng(seed)
+    rate = rng.normal(params.annual_rate, uncertainty.rate_sd, (samples, 1))
+    cut = np.clip(rng.normal(params.initial_cut, uncertainty.cut_sd, (samples, 1)), 0, 1)
+    sensitivity = rng.lognormal(0, uncertainty.sensitivity_sd, (samples, 1))
+
+    elapsed = np.arange(1, end_year - latest_year + 1)[np.newaxis, :]  # (1, years)
+    emissions = latest_total * (1 - cut) * (1 + rate) ** elapsed
+    temperature = TEMP_OFFSET + params.temp_per_year * sensitivity * elapsed
+    sea_level = SEA_OFFSET + params.sea_per_year * sensitivity * elapsed
+
+    # (outputs, percentiles, years)
+    return np.stack([np.percentile(a, PERCENTILES, axis=0) for a in (emissions, temperature, sea_level)])
+
+
+def _bands(years, chunks, sizes, complete):
+    weights = np.asarray(sizes, dtype=float)
+    estimate = np.tensordot(weights / weights.sum(), np.stack(chunks), axes=1)
+    return Bands(years, *estimate, samples=int(weights.sum()), complete=complete)
+
+
+def _remember(key, result):
+    with _results_lock:
+        _results[key] = result
+        while len(_results) > MAX_CACHED:
+            _results.popitem(last=False)
+
+
+def simulate(params, latest_total, latest_year, end_year, samples, seed,
+             uncertainty=Uncertainty(), workers=True):
+    """Yield percentile bands for one scenario, refined as chunks complete.
+
+    The last item yielded has ``complete=True``. Results are cached by their
+    inputs, so a repeated call, from any worker, yields that final item
+    straight away. With ``workers=False``, or when everything fits in one
+    chunk, the chunks run in this process.
+    """
+    params = ScenarioParams(*map(float, params))
+    key = (params, Uncertainty(*uncertainty), float(latest_total), int(latest_year),
+           int(end_year), int(samples), int(seed))
+    with _results_lock:
+        if key in _results:
+            _results.move_to_end(key)
+            yield _results[key]
+            return
+    # Not under the stampede lease: the chunks stream to the page as they land
+    shared = results.get("bands", key)
+    if shared:
+        _remember(key, shared[0])
+        yield shared[0]
+        return
+
+    years = np.arange(latest_year + 1, end_year + 1)
+    sizes = [CHUNK_SIZE] * (samples // CHUNK_SIZE)
+    if samples % CHUNK_SIZE:
+        sizes.append(samples % CHUNK_SIZE)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = [(params, key[1], latest_total, latest_year, end_year, size, chunk_seed)
+            for size, chunk_seed in zip(sizes, seeds)]
+
+    chunks = [None] * len(sizes)
+    done = []
+    if workers and len(sizes) > 1:
+        pool = _pool()
+        futures = {}
+        try:
+            futures = {pool.submit(_simulate_chunk, *a): i for i, a in enumerate(args)}
+            for future in as_completed(futures):
+                i = futures[future]
+                chunks[i] = future.result()
+                done.append(i)
+                if len(done) < len(sizes):
+                    yield _bands(years, [chunks[j] for j in done], [sizes[j] for j in done], False)
+        except BrokenProcessPool:
+            _discard_pool(pool)
+        finally:
+            # A rerun closes this generator mid-stream; its queued chunks
+            # would otherwise hold up the next run's
+            for future in futures:
+                future.cancel()
+
+    # Everything the pool didn't finish, or all of it without a pool
+    for i, a in enumerate(args):
+        if chunks[i] is None:
+            chunks[i] = _simulate_chunk(*a)
+            done.append(i)
+            if len(done) < len(sizes):
+                yield _bands(years, [chunks[j] for j in done], [sizes[j] for j in done], False)
+
+    # Combined in chunk order so the result doesn't depend on completion order
+    result = _bands(years, chunks, sizes, True)
+    _remember(key, result)
+    results.put("bands", key, result)
+    yield result
@@ -0,0 +1,31 @@
+"""Dashboard pages and the registry app.py renders them from.
+
+Each page lives in its own module with a ``render()`` function that loads the
+data it needs and draws its content. app.py only runs the page for the tab
+that is open, so interacting with one page never recomputes the others.
+
+Page modules, and the heavy libraries they use (pandas, numpy, Plotly), are
+imported the first time their page is rendered, not when the app starts, so
+a new worker can draw the page shell as soon as Streamlit itself is loaded.
+``benchmarks/check_import_time.py`` keeps it that way.
+"""
+
+import importlib
+from typing import NamedTuple
+
+
+class Page(NamedTuple):
+    label: str
+    module: str  # module under climate_pulse.pages
+
+    def render(self):
+        importlib.import_module(f"{__name__}.{self.module}").render()
+
+
+PAGES = [
+    Page("🌡️ Global Temperature Rise", "temperature"),
+    Page("🌍 CO₂ Emissions by Country", "emissions"),
+    Page("🌊 Sea Level Trends", "sea_level"),
+    Page("🔮 What-If Scenarios", "scenarios"),
+    Page("🧭 Personalized Action", "action"),
+]
@@ -0,0 +1,57 @@
+"""Personalized Action page."""
+
+import streamlit as st
+
+from climate_pulse import content, data
+from climate_pulse.footprint import score_person
+
+
+# Personalized Action Page
+def render():
+    emissions_index = data.emissions_index()
+
+    st.subheader("🧭 Climate Action Tips Based on Your Region")
+    country = st.selectbox("Where Are You From?", emissions_index.countries)
+    
+    # Get the appropriate actions
+    country_info = content.COUNTRY_ACTIONS.get(country, content.DEFAULT_ACTIONS)
+    
+    # Display personalized information
+    st.markdown(f"### 💡 Climate Impact Profile: {country}")
+    st.markdown(country_info["description"])
+    
+    st.markdown(f"**Highest impact focus area:** {country_info['highest_impact']}")
+    
+    st.markdown("### Recommended Actions")
+    for i, action in enumerate(country_info["actions"], 1):
+        st.markdown(f"{i}. {action}")
+    
+    # Calculate your impact section
+    st.subheader("Calculate Your Impact")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### Estimate Your Carbon Footprint")
+        flights = st.number_input("Flights per year", 0, 50, 2)
+        meat_consumption = st.slider("Meat consumption", 0, 7, 3, help="Days per week")
+        car_usage = st.slider("Car usage (km/week)", 0, 500, 100)
+        renewable_energy = st.checkbox("Do you use renewable energy at home?")
+    
+    with col2:
+        # Very simplified calculation, shared with batch scoring
+        score = score_person(flights, meat_consumption, car_usage, renewable_energy, country)
+        total_footprint = score["total_footprint"]
+        
+        st.markdown("### Your Estimated Annual Footprint")
+        st.markdown(f"## {total_footprint:.1f} tonnes CO2e")
+        
+        # Comparison to average
+        comparison = score["comparison_pct"]
+        
+        if comparison < 0:
+            st.success(f"Your footprint is {abs(comparison):.1f}% lower than the average in {country}!")
+        else:
+            st.warning(f"Your footprint is {comparison:.1f}% higher than the average in {country}")
+    
+    st.success("✅ You're part of the solution! Share this app and your results to raise awareness.")
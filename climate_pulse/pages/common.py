@@ -0,0 +1,28 @@
+"""Helpers shared by the page modules."""
+
+import streamlit as st
+
+from climate_pulse.downsample import POINT_BUDGET
+from climate_pulse.instrumentation import timed
+
+# Set to a list by climate_pulse.snapshot to collect the figures pages draw
+captured_figures = None
+
+
+def show_chart(fig):
+    if captured_figures is not None:
+        captured_figures.append(fig)
+    # Plotly serializes the figure here, so that is timed on its own
+    with timed("render"):
+        st.plotly_chart(fig, use_container_width=True)
+
+
+def zoom_range(df, x, key):
+    """Range slider for series too long to draw in full, otherwise None.
+
+    Zooming in re-resolves the downsampled series at full point budget.
+    """
+    if len(df) <= POINT_BUDGET:
+        return None
+    low, high = df[x].min().item(), df[x].max().item()
+    return st.slider("Zoom to years", low, high, (low, high), key=key)
@@ -0,0 +1,179 @@
+"""CO₂ Emissions by Country page."""
+
+import streamlit as st
+import plotly.express as px
+
+from climate_pulse import content, data
+from climate_pulse.downsample import downsample_frame
+from climate_pulse.figcache import cached_figure
+from climate_pulse.instrumentation import timed
+from climate_pulse.pages.common import show_chart, zoom_range
+from climate_pulse.regions import REST_OF_WORLD
+from climate_pulse.trends import METHODS
+
+
+def comparison_figure(filtered_data, version, countries, x_range):
+    plot_df = downsample_frame(filtered_data, "Year", "Emissions", key=("co2", version, countries),
+                               x_range=x_range, group="Country")
+    return px.line(plot_df, x="Year", y="Emissions", color="Country",
+                   title="Comparative CO₂ Emissions Trends",
+                   labels={"Emissions": "Emissions (MtCO₂)"})
+
+
+def group_figure(yearly):
+    long_df = yearly.melt(ignore_index=False, var_name="Year", value_name="Emissions").reset_index()
+    plot_df = downsample_frame(long_df, "Year", "Emissions", group="Group")
+    return px.line(plot_df, x="Year", y="Emissions", color="Group",
+                   title="CO₂ Emissions by Region and Group",
+                   labels={"Emissions": "Emissions (MtCO₂)"})
+
+
+def group_totals_figure(yearly):
+    # Groups may overlap (e.g. EU and G7), so totals are bars rather than pie shares
+    totals = yearly.sum(axis=1).rename("Emissions").reset_index()
+    return px.bar(totals, x="Group", y="Emissions", color="Group", title="Total Emissions",
+                  labels={"Emissions": "Emissions (MtCO₂)"})
+
+
+def share_figure(totals):
+    total_by_country = totals.reset_index()
+    return px.pie(total_by_country, values="Emissions", names="Country", 
+                  title="Total Emissions Share")
+
+
+def country_figure(country_data, version, country, x_range, trend):
+    plot_df = downsample_frame(country_data, "Year", "Emissions", key=("co2", version, country), x_range=x_range)
+    
+    fig = px.line(plot_df, x="Year", y="Emissions", 
+                title=f"{country} - CO₂ Emissions",
+                labels={"Emissions": "Emissions (MtCO₂)"})
+                
+    # Add trend line
+    if len(country_data) > 1:
+        fig.add_scatter(x=plot_df["Year"], y=trend.predict(plot_df["Year"]), mode="lines", line=dict(dash="dash", color="red"), name="Trend")
+    return fig
+
+
+def trend_growth(trend, stats):
+    # Growth along the fitted trend, which one noisy end point can't swing
+    start, end = trend.predict([stats.First_Year, stats.Last_Year])
+    if start <= 0:
+        return stats.Growth_Pct
+    return (end - start) / start * 100
+
+
+def group_comparison():
+    hierarchy = data.region_hierarchy()
+    cube = data.emissions_cube()
+
+    groups = st.multiselect(
+        "Select regions and groups to compare",
+        options=hierarchy.groups,
+        default=[g for g in ["EU", "G7"] if g in hierarchy.groups],
+        format_func=lambda group: f"{group} ({hierarchy.grouping_of[group]})"
+    )
+    custom = st.multiselect("Custom group (optional)", options=cube.countries)
+    include_rest = st.checkbox("Include rest of world", value=True)
+    if not groups and not custom:
+        st.info("Select at least one region, group or country.")
+        return
+
+    custom_groups = {"Custom group": custom} if custom else None
+    rest = REST_OF_WORLD if include_rest else None
+    key = (data.table_version("co2"), tuple(groups), tuple(custom), include_rest)
+    with timed("filter"):
+        yearly = cube.by_groups(groups, custom_groups, rest)
+    show_chart(cached_figure(("groups",) + key, lambda: group_figure(yearly)))
+    show_chart(cached_figure(("group_totals",) + key, lambda: group_totals_figure(yearly)))
+
+
+# CO2 Emissions Page
+def render():
+    emissions_index = data.emissions_index()
+
+    st.subheader("💨 CO₂ Emissions Over Time")
+    
+    # Add comparison option
+    comparison_mode = st.checkbox("Compare countries")
+    compare_by = "Countries"
+    if comparison_mode and data.region_hierarchy() is not None:
+        compare_by = st.radio("Compare", ["Countries", "Regions and groups"], horizontal=True)
+    
+    if compare_by == "Regions and groups":
+        group_comparison()
+    elif comparison_mode:
+        selected_countries = st.multiselect(
+            "Select countries to compare", 
+            options=emissions_index.countries,
+            default=["USA", "China", "India"]
+        )
+        
+        if selected_countries:
+            with timed("filter"):
+                filtered_data = emissions_index.select(selected_countries)
+            x_range = zoom_range(filtered_data, "Year", "compare_zoom")
+            version = data.table_version("co2")
+            countries = tuple(selected_countries)
+            fig = cached_figure(("comparison", version, countries, x_range),
+                                lambda: comparison_figure(filtered_data, version, countries, x_range))
+            show_chart(fig)
+            
+            # Add per country analysis
+            st.subheader("Country-specific Emission Analysis")
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Calculate emission growth rates
+                trends = data.trends()
+                for country in selected_countries:
+                    stats = emissions_index.stats(country)
+                    if stats.Rows >= 2:
+                        first_year = stats.First_Year
+                        last_year = stats.Last_Year
+                        growth_pct = trend_growth(trends.ols(country), stats)
+                        
+                        if growth_pct > 50:
+                            emoji = "🔴"
+                        elif growth_pct > 20:
+                            emoji = "🟠"
+                        else:
+                            emoji = "🟢"
+                            
+                        st.markdown(f"**{country}**: {emoji} {growth_pct:.1f}% growth from {first_year} to {last_year}")
+            
+            with col2:
+                # Show total emissions pie chart, from the cube's per-country totals
+                totals = data.emissions_cube().by_country(countries)
+                fig_pie = cached_figure(("share", version, countries), lambda: share_figure(totals))
+                show_chart(fig_pie)
+    else:
+        selected_country = st.selectbox("Select a Country", emissions_index.countries)
+        method = st.selectbox("Trend estimator", list(METHODS), format_func=METHODS.get)
+        with timed("filter"):
+            country_data = emissions_index.country_data(selected_country)
+        x_range = zoom_range(country_data, "Year", "country_zoom")
+        version = data.table_version("co2")
+        with timed("trend"):
+            trend = data.trends().fit(selected_country, method, country_data)
+        fig = cached_figure(("country", version, selected_country, x_range, method),
+                            lambda: country_figure(country_data, version, selected_country, x_range, trend))
+        show_chart(fig)
+        
+        st.markdown("### Country Analysis")
+        st.markdown(content.EMISSIONS_INSIGHTS.get(selected_country, content.DEFAULT_EMISSIONS_INSIGHT))
+        
+        # Growth rate from the fitted trend
+        stats = emissions_index.stats(selected_country)
+        if stats.Rows >= 2:
+            avg_annual_change = trend.slope
+            
+            st.markdown(f"**Average annual change**: {avg_annual_change:.2f} MtCO₂ per year "
+                        f"(fit error ±{trend.rmse:.1f} MtCO₂)")
+            if trend.breakpoint is not None:
+                st.markdown(f"**Trend break** in {trend.breakpoint:.0f}: from {trend.slope_before:+.2f} "
+                            f"to {trend.slope:+.2f} MtCO₂ per year")
+            
+            if avg_annual_change > 0:
+                st.warning(f"At this rate, emissions will increase by approximately {avg_annual_change * 10:.0f} MtCO₂ over the next decade.")
+            else:
+                st.success(f"Emissions are decreasing at a rate of {-avg_annual_change:.2f} MtCO₂ per year.")
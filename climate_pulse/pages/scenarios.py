@@ -0,0 +1,181 @@
+"""What-If Scenarios page."""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import numpy as np
+
+from climate_pulse import data
+from climate_pulse.figcache import cached_figure
+from climate_pulse.instrumentation import timed
+from climate_pulse.montecarlo import PERCENTILES, simulate
+from climate_pulse.pages.common import show_chart
+from climate_pulse.projections import SCENARIOS, SCENARIOS_BY_NAME, project
+from climate_pulse.regions import vulnerability_scores
+
+
+def projection_figure(base_co2, projection, shown, scenario_year):
+    # Create projection dataframe
+    totals = projection.total_emissions
+    projection_df = pd.DataFrame({
+        "Year": np.tile(projection.years, len(shown)),
+        "Emissions": totals.ravel(),
+        "Scenario": np.repeat([s.name for s in shown], len(projection.years))
+    })
+    
+    # Combine with historical data
+    historical_df = pd.DataFrame({
+        "Year": base_co2["Year"],
+        "Emissions": base_co2["Emissions"],
+        "Scenario": ["Historical"] * len(base_co2)
+    })
+    
+    combined_df = pd.concat([historical_df, projection_df])
+    
+    color_map = {"Historical": "blue"}
+    color_map.update({s.name: s.color for s in shown})
+    return px.line(combined_df, x="Year", y="Emissions", color="Scenario",
+                   title=f"Emissions Projection to {scenario_year}",
+                   color_discrete_map=color_map)
+
+
+def impact_figure(scenario, scores):
+    return px.bar(
+        scores.rename_axis("Region").reset_index(),
+        x="Region",
+        y="Vulnerability Score",
+        color="Region",
+        title=f"Regional Vulnerability with {scenario}"
+    )
+
+
+def band_figure(years, bands, label, color):
+    """Median line with a shaded band between the outer percentiles."""
+    fig = px.line(x=years, y=bands[len(bands) // 2], labels={"x": "Year", "y": label}, title=label)
+    fig.update_traces(line=dict(color=color), name="Median")
+    fig.add_scatter(x=years, y=bands[-1], mode="lines", line=dict(width=0), showlegend=False,
+                    name=f"{PERCENTILES[-1]}th percentile")
+    fig.add_scatter(x=years, y=bands[0], mode="lines", line=dict(width=0), fill="tonexty",
+                    fillcolor="rgba(128, 128, 128, 0.3)", showlegend=False,
+                    name=f"{PERCENTILES[0]}th percentile")
+    return fig
+
+
+# What-If Scenarios Page
+def render():
+    emissions_cube = data.emissions_cube()
+
+    st.subheader("🔮 Climate Projection Scenarios")
+    
+    scenario = st.radio(
+        "Select emissions scenario",
+        [s.name for s in SCENARIOS]
+    )
+    overlays = st.multiselect(
+        "Overlay other scenarios",
+        [s.name for s in SCENARIOS if s.name != scenario]
+    )
+    
+    scenario_year = st.slider("Project to year", 2025, 2100, 2050)
+    
+    # Create simplified projection model. Countries that have not reported
+    # the latest years yet count at their last reported value, both in the
+    # historical line and as the projection's starting point.
+    with timed("filter"):
+        reported = emissions_cube.carried_forward()
+    base_co2 = pd.DataFrame({"Year": emissions_cube.years, "Emissions": reported.sum(axis=0)})
+    latest_year = base_co2["Year"].max()
+    
+    # One broadcast over every shown scenario, country and year. Projections
+    # start from the same totals as the historical line, so the two meet.
+    shown = [SCENARIOS_BY_NAME[name] for name in [scenario] + overlays]
+    latest_emissions = reported[:, -1]  # per country, in the cube's order
+    end_year = max(scenario_year, latest_year + 1)
+    with timed("projection"):
+        projection = project([s.params for s in shown], latest_emissions, latest_year, end_year)
+    
+    selected = shown[0]
+    temp_increase = projection.temperature[0, -1]
+    sea_increase = projection.sea_level[0, -1]
+    scenario_description = selected.description
+    impact_level = selected.impact_level
+    
+    # Plot projections
+    fig = cached_figure(
+        ("projection", data.table_version("co2"), tuple(s.name for s in shown), scenario_year),
+        lambda: projection_figure(base_co2, projection, shown, scenario_year)
+    )
+    show_chart(fig)
+    
+    # Monte Carlo uncertainty bands, redrawn as each chunk of samples lands
+    if st.checkbox("Show uncertainty bands (Monte Carlo)"):
+        col1, col2 = st.columns(2)
+        with col1:
+            samples = st.select_slider("Sampled trajectories", [10_000, 25_000, 50_000, 100_000])
+        with col2:
+            seed = st.number_input("Random seed", 0, 2**31 - 1, 0)
+        
+        progress = st.empty()
+        charts = [column.empty() for column in st.columns(3)]
+        outputs = [
+            ("emissions", "Emissions (MtCO₂)"),
+            ("temperature", "Temperature Increase (°C)"),
+            ("sea_level", "Sea Level Rise (mm)"),
+        ]
+        for bands in simulate(selected.params, latest_emissions.sum(), latest_year, end_year, samples, seed):
+            for chart, (field, label) in zip(charts, outputs):
+                chart.plotly_chart(band_figure(bands.years, getattr(bands, field), label, selected.color),
+                                   use_container_width=True)
+            if not bands.complete:
+                progress.caption(f"Sampled {bands.samples:,} of {samples:,} trajectories...")
+        progress.caption(f"{PERCENTILES[0]}th–{PERCENTILES[-1]}th percentile band and median "
+                         f"of {samples:,} sampled trajectories (seed {seed})")
+    
+    # Show impact metrics
+    st.markdown(f"### Projected Climate Impacts by {scenario_year}")
+    st.info(scenario_description)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric(
+            "Temperature Increase",
+            f"+{temp_increase:.2f}°C",
+            f"Impact: {impact_level}"
+        )
+    
+    with col2:
+        st.metric(
+            "Sea Level Rise",
+            f"+{sea_increase:.0f}mm",
+            f"From {latest_year}"
+        )
+    
+    with col3:
+        # Calculate arbitrary vulnerability index
+        if impact_level == "Severe":
+            vulnerability = 85
+        elif impact_level == "Moderate":
+            vulnerability = 60
+        else:
+            vulnerability = 30
+            
+        st.metric(
+            "Coastal Vulnerability Index",
+            f"{vulnerability}/100",
+            None
+        )
+    
+    # Regional impact section
+    st.subheader("Regional Impact Projection")
+    
+    # Each region's vulnerability, scaled by the warming projected from the data
+    hierarchy, vulnerability = data.region_hierarchy(), data.vulnerability()
+    if hierarchy is None or vulnerability is None:
+        st.info("Add data/regions.csv and data/vulnerability.csv to see regional vulnerability.")
+    else:
+        fig_impact = cached_figure(
+            ("impact", data.table_version("co2"), scenario, scenario_year),
+            lambda: impact_figure(scenario, vulnerability_scores(hierarchy, vulnerability, temp_increase))
+        )
+        show_chart(fig_impact)
@@ -0,0 +1,43 @@
+"""Sea Level Trends page."""
+
+import streamlit as st
+import plotly.express as px
+
+from climate_pulse import content, data
+from climate_pulse.downsample import downsample_frame
+from climate_pulse.figcache import cached_figure
+from climate_pulse.pages.common import show_chart, zoom_range
+
+
+def sea_level_figure(sea_df, version, x_range):
+    plot_df = downsample_frame(sea_df, "Year", "Sea_Level_Change", key=("sea", version), x_range=x_range)
+    fig = px.line(plot_df, x="Year", y="Sea_Level_Change", 
+                  title="Global Sea Level Rise (mm)",
+                  labels={"Sea_Level_Change": "Sea Level Rise (mm)"})
+                  
+    # Add trend annotation
+    trend_slope = (sea_df["Sea_Level_Change"].iloc[-1] - sea_df["Sea_Level_Change"].iloc[0]) / (sea_df["Year"].iloc[-1] - sea_df["Year"].iloc[0])
+    fig.add_annotation(x=1950, y=80,
+        text=f"Avg. rise: {trend_slope:.1f} mm/year",
+        showarrow=False,
+        bgcolor="rgba(255, 255, 255, 0.8)")
+    return fig
+
+
+# Sea Level Page
+def render():
+    sea_df = data.sea_level_table()
+
+    st.subheader("🌊 Global Sea Level Rise")
+    x_range = zoom_range(sea_df, "Year", "sea_zoom")
+    version = data.table_version("sea")
+    fig = cached_figure(("sea_level", version, x_range),
+                        lambda: sea_level_figure(sea_df, version, x_range))
+    show_chart(fig)
+    
+    st.markdown(content.SEA_LEVEL_INSIGHTS)
+    
+    # Regional impact tab system
+    for region_tab, text in zip(st.tabs(list(content.SEA_LEVEL_REGIONS)), content.SEA_LEVEL_REGIONS.values()):
+        with region_tab:
+            st.markdown(text)
@@ -0,0 +1,57 @@
+"""Global Temperature Rise page."""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from climate_pulse import content, data
+from climate_pulse.downsample import downsample_frame
+from climate_pulse.figcache import cached_figure
+from climate_pulse.pages.common import show_chart, zoom_range
+
+
+def temperature_figure(temp_df, version, x_range):
+    plot_df = downsample_frame(temp_df, "Year", "Temp_Anomaly", key=("temp", version), x_range=x_range)
+    fig = px.line(plot_df, x="Year", y="Temp_Anomaly", 
+                  title="Temperature Anomaly (°C) Over Time",
+                  labels={"Temp_Anomaly": "Temperature Anomaly (°C)"})
+    fig.update_layout(
+        annotations=[
+            dict(
+                x=2010,
+                y=0.7,
+                xref="x",
+                yref="y",
+                text="Critical threshold approaching",
+                showarrow=True,
+                arrowhead=1
+            )
+        ]
+    )
+    return fig
+
+
+def milestones_figure():
+    milestone_df = pd.DataFrame(content.MILESTONES)
+    
+    return px.bar(milestone_df, x="Milestone", y="Temperature (°C)", color="Status", 
+                  color_discrete_map=content.MILESTONE_COLORS)
+
+
+# Global Temperature Rise Page
+def render():
+    temp_df = data.temperature_table()
+
+    st.subheader("📈 Global Temperature Rise Over Time")
+    x_range = zoom_range(temp_df, "Year", "temp_zoom")
+    version = data.table_version("temp")
+    fig = cached_figure(("temperature", version, x_range),
+                        lambda: temperature_figure(temp_df, version, x_range))
+    show_chart(fig)
+    
+    st.markdown(content.TEMPERATURE_INSIGHTS)
+    
+    # Adding a temperature milestone visualization
+    st.subheader("Temperature Milestones")
+    fig_milestones = cached_figure(("milestones",), milestones_figure)
+    show_chart(fig_milestones)
@@ -0,0 +1,130 @@
+"""Vectorized projection engine for the What-If scenarios.
+
+A scenario is a row of parameters: an immediate cut applied to the latest
+emissions, an annual growth (positive) or decay (negative) rate applied after
+the cut, and linear temperature and sea-level sensitivities per projected
+year. ``project`` evaluates every scenario x country x year combination in a
+single NumPy broadcast and memoizes the result by its parameter tuple, so
+overlaying scenarios or sweeping a parameter grid costs no Python-level loops.
+Results are also kept in the shared result cache, for the other workers.
+"""
+
+from functools import lru_cache
+from itertools import product
+from typing import NamedTuple
+
+import numpy as np
+
+from climate_pulse.sharedcache import PAGE_LEASE, results
+
+# Warming and sea-level rise already locked in at the latest observed year
+TEMP_OFFSET = 0.3  # °C
+SEA_OFFSET = 40  # mm
+
+
+class ScenarioParams(NamedTuple):
+    initial_cut: float  # fraction of latest emissions cut immediately
+    annual_rate: float  # growth (>0) or decay (<0) per year after the cut
+    temp_per_year: float  # °C of warming per projected year
+    sea_per_year: float  # mm of sea-level rise per projected year
+
+
+class Scenario(NamedTuple):
+    name: str
+    params: ScenarioParams
+    impact_level: str
+    color: str
+    description: str
+
+
+SCENARIOS = [
+    Scenario(
+        "Business as usual",
+        ScenarioParams(initial_cut=0.0, annual_rate=0.02, temp_per_year=0.015, sea_per_year=3),
+        "Severe",
+        "red",
+        "Continuing current emission trends will significantly accelerate climate change.",
+    ),
+    Scenario(
+        "Moderate reduction (30% cut)",
+        ScenarioParams(initial_cut=0.3, annual_rate=-0.03, temp_per_year=0.008, sea_per_year=2),
+        "Moderate",
+        "orange",
+        "A 30% emissions cut would slow climate change but may not prevent significant impacts.",
+    ),
+    Scenario(
+        "Aggressive reduction (60% cut)",
+        ScenarioParams(initial_cut=0.6, annual_rate=-0.05, temp_per_year=0.004, sea_per_year=1),
+        "Manageable",
+        "green",
+        "Aggressive 60% cuts could help limit warming to safer levels.",
+    ),
+]
+
+SCENARIOS_BY_NAME = {scenario.name: scenario for scenario in SCENARIOS}
+
+
+class Projection(NamedTuple):
+    years: np.ndarray  # (years,)
+    emissions: np.ndarray  # (scenarios, countries, years)
+    temperature: np.ndarray  # (scenarios, years), °C above the latest year
+    sea_level: np.ndarray  # (scenarios, years), mm above the latest year
+
+    @property
+    def total_emissions(self):
+        """Emissions summed over countries, shape (scenarios, years)."""
+        return self.emissions.sum(axis=1)
+
+
+def parameter_grid(**axes):
+    """All combinations of the given parameter values, as a tuple of ScenarioParams.
+
+    Parameters not named keep the business-as-usual value, e.g.
+    ``parameter_grid(annual_rate=np.linspace(-0.05, 0.02, 8))``.
+    """
+    defaults = SCENARIOS[0].params._asdict()
+    names = list(defaults)
+    values = [np.atleast_1d(axes.get(name, defaults[name])) for name in names]
+    return tuple(ScenarioParams(*map(float, combo)) for combo in product(*values))
+
+
+def project(params, latest_emissions, latest_year, end_year):
+    """Project every scenario in ``params`` from ``latest_year`` to ``end_year``.
+
+    ``params`` is a sequence of ScenarioParams and ``latest_emissions`` holds
+    each country's emissions in ``latest_year``. The arrays in the returned
+    Projection are shared between callers and are read-only.
+    """
+    return _project(
+        tuple(ScenarioParams(*p) for p in params),
+        tuple(float(e) for e in np.atleast_1d(latest_emissions)),
+        int(latest_year),
+        int(end_year),
+    )
+
+
+@lru_cache(maxsize=256)
+def _project(params, latest_emissions, latest_year, end_year):
+    projection = results.get_or_compute(
+        "projection", (params, latest_emissions, latest_year, end_year),
+        lambda: _compute(params, latest_emissions, latest_year, end_year),
+        lease=PAGE_LEASE,
+    )
+    for array in projection:
+        array.flags.writeable = False
+    return projection
+
+
+def _compute(params, latest_emissions, latest_year, end_year):
+    table = np.array(params, dtype=float).reshape(-1, len(ScenarioParams._fields))
+    cut, rate, temp_per_year, sea_per_year = (table[:, [i]] for i in range(table.shape[1]))
+
+    years = np.arange(latest_year + 1, end_year + 1)
+    elapsed = (years - latest_year)[np.newaxis, :]  # (1, years)
+    base = np.asarray(latest_emissions)[np.newaxis, :, np.newaxis]  # (1, countries, 1)
+
+    factor = (1 - cut) * (1 + rate) ** elapsed  # (scenarios, years)
+    emissions = base * factor[:, np.newaxis, :]
+    temperature = TEMP_OFFSET + temp_per_year * elapsed
+    sea_level = SEA_OFFSET + sea_per_year * elapsed
+    return Projection(years, emissions, temperature, sea_level)
@@ -0,0 +1,144 @@
+"""Country groupings (continents, income groups, blocs) and roll-ups over them.
+
+``data/regions.csv`` lists one membership per row as Country, Grouping and
+Group, e.g. ``Germany,Bloc,EU``. A country can be in several groups of one
+grouping (Germany is in both the EU and the G7). Group names must be unique
+across groupings.
+
+Memberships are held as two integer-coded arrays: a group code and a country
+code per membership. Together they form the coordinate (COO) form of a
+sparse group-by-country indicator matrix. Rolling per-country values up to
+groups is a product with that matrix. It is done as a single ``np.add.at``
+over the memberships, so comparing "EU vs G7 vs rest of world" over the full
+timeline costs one pass over the member rows, whatever the number of groups.
+
+``data/vulnerability.csv`` holds a climate vulnerability index per country
+(0 to 1, higher is more vulnerable). The regional vulnerability chart
+averages it per region and scales it by a scenario's projected warming.
+"""
+
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+REGIONS_FILENAME = "regions.csv"
+VULNERABILITY_FILENAME = "vulnerability.csv"
+REST_OF_WORLD = "Rest of world"
+
+# Groups charted next to the first grouping's regions in the vulnerability chart
+VULNERABILITY_EXTRA_GROUPS = ["Small Island States"]
+# Added warming (°C) at which a region's score equals its vulnerability index
+WARMING_REFERENCE = 0.5
+
+
+class RegionHierarchy:
+    def __init__(self, memberships):
+        group_codes, groups = pd.factorize(memberships["Group"])
+        country_codes, countries = pd.factorize(memberships["Country"])
+        self.groups = [str(g) for g in groups]
+        self.countries = [str(c) for c in countries]
+        self._group_codes = group_codes.astype(np.int32)
+        self._country_codes = country_codes.astype(np.int32)
+
+        grouping_of = memberships.drop_duplicates(["Group", "Grouping"]).set_index("Group")["Grouping"]
+        if grouping_of.index.has_duplicates:
+            duplicated = sorted(set(grouping_of.index[grouping_of.index.duplicated()]))
+            raise ValueError(f"groups listed under more than one grouping: {', '.join(duplicated)}")
+        self.grouping_of = grouping_of.to_dict()
+        self.groupings = list(dict.fromkeys(memberships["Grouping"]))
+        # Identifies the memberships, for caches of results that depend on them
+        hashes = pd.util.hash_pandas_object(memberships[["Country", "Grouping", "Group"]], index=False)
+        self.digest = hashlib.sha1(hashes.to_numpy().tobytes()).hexdigest()[:16]
+
+    def groups_in(self, grouping):
+        return [g for g in self.groups if self.grouping_of[g] == grouping]
+
+    def members(self, group):
+        codes = self._country_codes[self._group_codes == self.groups.index(group)]
+        return [self.countries[c] for c in codes]
+
+    def _memberships(self, countries, groups, custom, rest):
+        # Map the hierarchy's country codes to positions in `countries`
+        positions = {country: i for i, country in enumerate(countries)}
+        columns = np.array([positions.get(c, -1) for c in self.countries], dtype=np.int64)
+
+        names, rows, cols = [], [], []
+        for group in groups:
+            cols_in = columns[self._country_codes[self._group_codes == self.groups.index(group)]]
+            cols.append(cols_in[cols_in >= 0])
+            names.append(group)
+        for name, members in (custom or {}).items():
+            cols.append(np.array([positions[c] for c in members if c in positions], dtype=np.int64))
+            names.append(name)
+        if rest is not None:
+            covered = np.zeros(len(countries), dtype=bool)
+            for cols_in in cols:
+                covered[cols_in] = True
+            cols.append(np.flatnonzero(~covered))
+            names.append(rest)
+
+        rows = [np.full(len(cols_in), row, dtype=np.int64) for row, cols_in in enumerate(cols)]
+        if not rows:
+            return names, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        return names, np.concatenate(rows), np.concatenate(cols)
+
+    def rollup(self, values, countries, groups, custom=None, rest=None, how="sum"):
+        """Roll per-country ``values`` up to groups.
+
+        ``values`` has one entry (or one row, e.g. a timeline) per country in
+        ``countries``. ``groups`` names groups from the hierarchy; ``custom``
+        adds ad-hoc groups as ``{name: [countries]}``. If ``rest`` is given,
+        a group by that name collects every country in none of the others.
+        ``how`` is "sum" or "mean" (over the members present in ``countries``).
+
+        Returns a Series for 1-d ``values`` and a DataFrame otherwise, indexed
+        by group.
+        """
+        names, rows, cols = self._memberships(countries, groups, custom, rest)
+        values = np.asarray(values, dtype=float)
+        totals = np.zeros((len(names),) + values.shape[1:])
+        np.add.at(totals, rows, values[cols])
+        if how == "mean":
+            sizes = np.bincount(rows, minlength=len(names)).astype(float)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                totals = totals / sizes.reshape((-1,) + (1,) * (totals.ndim - 1))
+        elif how != "sum":
+            raise ValueError(f"unknown roll-up {how!r}; expected 'sum' or 'mean'")
+
+        index = pd.Index(names, name="Group")
+        if totals.ndim == 1:
+            return pd.Series(totals, index=index)
+        return pd.DataFrame(totals, index=index)
+
+
+def load_hierarchy(data_dir):
+    """The hierarchy in ``<data_dir>/regions.csv``, or None if there is none."""
+    path = os.path.join(data_dir, REGIONS_FILENAME)
+    if not os.path.exists(path):
+        return None
+    return RegionHierarchy(pd.read_csv(path))
+
+
+def load_vulnerability(data_dir):
+    """Vulnerability index per country, or None if there is no file for it."""
+    path = os.path.join(data_dir, VULNERABILITY_FILENAME)
+    if not os.path.exists(path):
+        return None
+    return pd.read_csv(path).set_index("Country")["Vulnerability"]
+
+
+def vulnerability_scores(hierarchy, vulnerability, warming):
+    """Vulnerability score (0-100) per region for a projected added ``warming``.
+
+    A region's index is the mean of its member countries' indices. The score
+    scales it by the warming relative to ``WARMING_REFERENCE``, capped at 100.
+    Regions with no member in ``vulnerability`` are left out rather than
+    scored 0.
+    """
+    groups = hierarchy.groups_in(hierarchy.groupings[0])
+    groups += [g for g in VULNERABILITY_EXTRA_GROUPS if g in hierarchy.groups]
+    index = hierarchy.rollup(vulnerability.to_numpy(), list(vulnerability.index), groups, how="mean")
+    hazard = max(warming, 0.0) / WARMING_REFERENCE
+    return (index.dropna() * hazard * 100).clip(upper=100).rename("Vulnerability Score")
@@ -0,0 +1,482 @@
+"""Result cache shared by every Streamlit worker process on a host.
+
+Each worker used to build its own copy of the emissions aggregates and
+recompute the same projections. Results are now stored once, in a backend
+all workers can reach, under a content address. The address is a SHA-256 of
+the result's namespace, every input it depends on (dataset versions,
+parameters, ...) and the source of this package, so a deploy never serves
+results computed by older code. Nothing needs invalidating: a new version
+of an input is a new address, and stale entries age out.
+
+Backends store bytes under string keys. ``SQLiteBackend`` is the default: a
+single WAL-mode SQLite file, with per-entry TTL and least-recently-used
+eviction past a size cap. ``RedisBackend`` puts the same protocol on a
+Redis server (TTL and eviction are then Redis's ``EX`` and ``maxmemory``);
+``LocalRedis`` stands in for one in-process.
+
+When several workers miss on the same key together, one computes the value
+and the rest wait for it (stampede protection). The computing worker holds a
+lease: an ``add``-only key that expires after ``lease`` seconds, so a worker
+that dies mid-computation only delays the others. Waiters poll with reads
+and only try for the lease again once it could have expired; a page-level
+computation takes a short lease (``PAGE_LEASE``), so it is never held up for
+long. A worker releases the
+lease only while it still holds it, so one whose lease expired mid-computation
+never releases a lease another worker has since taken. Backend errors are
+counted and otherwise ignored; the value is then computed locally.
+
+Values are pickled. Anyone who can write to the backend can run code in the
+workers, so keep the SQLite file, or the Redis server, private to the app.
+
+Configured through the environment:
+
+- ``CLIMATE_PULSE_CACHE_URL``: ``sqlite:///<path>`` (the default is
+  ``<data dir>/.store/results.sqlite``), ``redis://host:port/db`` (needs the
+  ``redis`` package), ``local-redis:`` or ``off``.
+- ``CLIMATE_PULSE_CACHE_MB``: size cap of the SQLite backend (512).
+- ``CLIMATE_PULSE_CACHE_TTL``: seconds an entry lives (86400).
+"""
+
+import abc
+import glob
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import uuid
+
+from climate_pulse.instrumentation import count, timed
+
+DATA_DIR = os.environ.get("CLIMATE_PULSE_DATA_DIR", "data")
+CACHE_URL = os.environ.get(
+    "CLIMATE_PULSE_CACHE_URL", "sqlite:///" + os.path.join(DATA_DIR, ".store", "results.sqlite"))
+DEFAULT_MAX_BYTES = int(os.environ.get("CLIMATE_PULSE_CACHE_MB", "512")) * 1024 * 1024
+DEFAULT_TTL = float(os.environ.get("CLIMATE_PULSE_CACHE_TTL", "86400"))  # seconds
+DEFAULT_LEASE = 300.0  # seconds a computation may hold its key before others take over
+PAGE_LEASE = 10.0  # the same, for computations a page render waits on
+POLL_INTERVAL = 0.05  # seconds between checks while waiting on another worker
+ACCESS_RESOLUTION = 10.0  # seconds; hits on a fresher entry don't rewrite its access time
+
+# Deletes KEYS[1] only if it holds ARGV[1], atomically on the server
+DELETE_IF_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class CacheBackend(abc.ABC):
+    """Bytes stored under string keys, each expiring after ``ttl`` seconds.
+
+    This is the subset of Redis the cache relies on: ``get`` is ``GET``,
+    ``set`` is ``SET EX``, ``add`` is ``SET NX EX``, ``delete`` is ``DEL``
+    and ``delete_if`` is a compare-and-delete script.
+    """
+
+    @abc.abstractmethod
+    def get(self, key):
+        """The value stored under ``key``, or None if absent or expired."""
+
+    @abc.abstractmethod
+    def set(self, key, value, ttl):
+        pass
+
+    @abc.abstractmethod
+    def add(self, key, value, ttl):
+        """Store ``value`` only if ``key`` is absent; True if it was stored."""
+
+    @abc.abstractmethod
+    def delete(self, key):
+        pass
+
+    @abc.abstractmethod
+    def delete_if(self, key, value):
+        """Delete ``key`` only if it still holds ``value``; True if it was deleted."""
+
+    def usage(self):
+        """``{"entries", "bytes", "max_bytes"}`` where the backend knows them."""
+        return {}
+
+
+class SQLiteBackend(CacheBackend):
+    """One SQLite file, shared by every process that opens the same path.
+
+    Writes are serialized by SQLite's own file lock. Once the stored values
+    pass ``max_bytes``, expired entries are dropped, then the least recently
+    read ones. Triggers keep the running total of stored bytes, so a write
+    doesn't sum the whole table. Access times are only rewritten every
+    ``ACCESS_RESOLUTION`` seconds, so hits stay reads.
+    """
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+
+    def _connection(self):
+        # One connection per thread, and never one inherited through fork
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # INSERT OR REPLACE then fires the delete trigger for the old row
+            conn.execute("PRAGMA recursive_triggers=ON")
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                    "size INTEGER NOT NULL, expires REAL NOT NULL, accessed REAL NOT NULL)")
+                conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+                conn.execute("CREATE TABLE IF NOT EXISTS totals (id INTEGER PRIMARY KEY CHECK (id = 0), "
+                             "bytes INTEGER NOT NULL)")
+                conn.execute("INSERT OR IGNORE INTO totals "
+                             "SELECT 0, COALESCE(SUM(size), 0) FROM entries")
+                conn.execute("CREATE TRIGGER IF NOT EXISTS entries_added AFTER INSERT ON entries "
+                             "BEGIN UPDATE totals SET bytes = bytes + NEW.size; END")
+                conn.execute("CREATE TRIGGER IF NOT EXISTS entries_removed AFTER DELETE ON entries "
+                             "BEGIN UPDATE totals SET bytes = bytes - OLD.size; END")
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def get(self, key):
+        conn = self._connection()
+        row = conn.execute("SELECT value, expires, accessed FROM entries WHERE key = ?", (key,)).fetchone()
+        now = time.time()
+        if row is None or row[1] <= now:
+            return None
+        if now - row[2] > ACCESS_RESOLUTION:
+            conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        return row[0]
+
+    def set(self, key, value, ttl):
+        if len(value) > self.max_bytes:
+            return
+        conn = self._connection()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                         (key, value, len(value), now + ttl, now))
+            self._evict(conn, now)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def add(self, key, value, ttl):
+        conn = self._connection()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM entries WHERE key = ? AND expires <= ?", (key, now))
+            added = conn.execute("INSERT OR IGNORE INTO entries VALUES (?, ?, ?, ?, ?)",
+                                 (key, value, len(value), now + ttl, now)).rowcount == 1
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return added
+
+    def delete(self, key):
+        self._connection().execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def delete_if(self, key, value):
+        return self._connection().execute(
+            "DELETE FROM entries WHERE key = ? AND value = ?", (key, value)).rowcount == 1
+
+    @staticmethod
+    def _total(conn):
+        return conn.execute("SELECT bytes FROM totals").fetchone()[0]
+
+    def _evict(self, conn, now):
+        if self._total(conn) <= self.max_bytes:
+            return
+        conn.execute("DELETE FROM entries WHERE expires <= ?", (now,))
+        total = self._total(conn)
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed").fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+
+    def clear(self):
+        self._connection().execute("DELETE FROM entries")
+
+    def usage(self):
+        conn = self._connection()
+        (entries,) = conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        return {"entries": entries, "bytes": self._total(conn), "max_bytes": self.max_bytes}
+
+
+class RedisBackend(CacheBackend):
+    """The cache protocol on a redis-py compatible client.
+
+    Expiry and eviction are left to the server; run it with a ``maxmemory``
+    limit and ``allkeys-lru``.
+    """
+
+    def __init__(self, client, prefix="climate_pulse:"):
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key):
+        return self.client.get(self.prefix + key)
+
+    def set(self, key, value, ttl):
+        self.client.set(self.prefix + key, value, px=max(int(ttl * 1000), 1))
+
+    def add(self, key, value, ttl):
+        return bool(self.client.set(self.prefix + key, value, px=max(int(ttl * 1000), 1), nx=True))
+
+    def delete(self, key):
+        self.client.delete(self.prefix + key)
+
+    def delete_if(self, key, value):
+        return bool(self.client.eval(DELETE_IF_SCRIPT, 1, self.prefix + key, value))
+
+
+class LocalRedis:
+    """In-process stand-in for a Redis server, for ``RedisBackend``.
+
+    Implements ``get``, ``set`` (with ``ex``, ``px`` and ``nx``) and
+    ``delete`` as redis-py does, plus ``eval`` of ``DELETE_IF_SCRIPT``, and
+    evicts least recently used keys past ``maxmemory`` bytes. Only threads of
+    one process share it.
+    """
+
+    def __init__(self, maxmemory=DEFAULT_MAX_BYTES):
+        self.maxmemory = maxmemory
+        self._data = {}  # key -> (value, expires or None); insertion order is recency
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def _live(self, key, now):
+        entry = self._data.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= now:
+            self._drop(key)
+            return None
+        return entry
+
+    def _drop(self, key):
+        value, _ = self._data.pop(key)
+        self._bytes -= len(value)
+
+    def get(self, name):
+        with self._lock:
+            entry = self._live(name, time.monotonic())
+            if entry is None:
+                return None
+            self._data[name] = self._data.pop(name)
+            return entry[0]
+
+    def set(self, name, value, ex=None, px=None, nx=False):
+        if isinstance(value, str):
+            value = value.encode()
+        now = time.monotonic()
+        expires = now + ex if ex is not None else now + px / 1000 if px is not None else None
+        with self._lock:
+            if self._live(name, now) is not None:
+                if nx:
+                    return None
+                self._drop(name)
+            self._data[name] = (value, expires)
+            self._bytes += len(value)
+            while self._bytes > self.maxmemory and self._data:
+                self._drop(next(iter(self._data)))
+            return True
+
+    def delete(self, *names):
+        with self._lock:
+            present = [name for name in names if name in self._data]
+            for name in present:
+                self._drop(name)
+            return len(present)
+
+    def eval(self, script, numkeys, *keys_and_args):
+        if script != DELETE_IF_SCRIPT:
+            raise NotImplementedError("LocalRedis only runs DELETE_IF_SCRIPT")
+        (name,), (value,) = keys_and_args[:numkeys], keys_and_args[numkeys:]
+        if isinstance(value, str):
+            value = value.encode()
+        with self._lock:
+            entry = self._live(name, time.monotonic())
+            if entry is None or entry[0] != value:
+                return 0
+            self._drop(name)
+            return 1
+
+    def flushall(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+
+def backend_from_url(url, max_bytes=DEFAULT_MAX_BYTES):
+    """The backend a ``CLIMATE_PULSE_CACHE_URL`` value names, or None for ``off``."""
+    if not url or url == "off":
+        return None
+    if url.startswith("sqlite:///"):
+        return SQLiteBackend(url[len("sqlite:///"):], max_bytes)
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError(f"CLIMATE_PULSE_CACHE_URL={url} needs the redis package") from None
+        return RedisBackend(redis.Redis.from_url(url))
+    if url.startswith("local-redis:"):
+        return RedisBackend(LocalRedis(max_bytes))
+    raise ValueError(f"unsupported cache URL {url!r}; expected sqlite:///, redis://, local-redis: or off")
+
+
+def _code_version():
+    # Hash of this package's source: results never outlive the code that made them
+    root = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(root, "**", "*.py"), recursive=True)):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+class SharedCache:
+    def __init__(self, backend, ttl=DEFAULT_TTL, lease=DEFAULT_LEASE):
+        self.backend = backend
+        self.ttl = ttl
+        self.lease = lease
+        self._code = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0  # misses served by another worker's computation
+        self.errors = 0
+
+    def address(self, namespace, inputs):
+        """Content address of the result of ``namespace`` for ``inputs``."""
+        if self._code is None:
+            self._code = _code_version()
+        digest = hashlib.sha256(pickle.dumps((self._code, inputs), protocol=pickle.HIGHEST_PROTOCOL))
+        return f"{namespace}:{digest.hexdigest()}"
+
+    def _call(self, method, *args):
+        # A broken cache costs a recomputation, never a page
+        try:
+            return getattr(self.backend, method)(*args)
+        except Exception:
+            self._count("errors")
+            return None
+
+    def _load(self, key):
+        value = self._call("get", key)
+        if value is None:
+            return None
+        try:
+            return (pickle.loads(value),)
+        except Exception:
+            self._call("delete", key)
+            return None
+
+    def _count(self, outcome):
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+        count(f"cache_{outcome}_total", cache="shared")
+
+    def get(self, namespace, inputs):
+        """The stored result as a 1-tuple, or None on a miss."""
+        if self.backend is None:
+            return None
+        with timed("shared_cache"):
+            found = self._load(self.address(namespace, inputs))
+        self._count("hits" if found else "misses")
+        return found
+
+    def _store(self, key, value, ttl):
+        with timed("shared_cache"):
+            try:
+                data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                self._count("errors")
+                return
+            self._call("set", key, data, ttl or self.ttl)
+
+    def put(self, namespace, inputs, value, ttl=None):
+        if self.backend is not None:
+            self._store(self.address(namespace, inputs), value, ttl)
+
+    def get_or_compute(self, namespace, inputs, compute, ttl=None, lease=None):
+        """The result for ``inputs``, calling ``compute()`` only if no worker has it.
+
+        Concurrent misses on one address compute it once: the first takes
+        the lease and computes, the rest wait until its result lands.
+        ``lease`` (seconds, ``self.lease`` by default) bounds how long a dead
+        worker's lease holds the others up.
+        """
+        if self.backend is None:
+            return compute()
+        key = self.address(namespace, inputs)
+        with timed("shared_cache"):
+            found = self._load(key)
+        if found:
+            self._count("hits")
+            return found[0]
+        self._count("misses")
+
+        lease_seconds = self.lease if lease is None else lease
+        lease, owner = f"lease:{key}", uuid.uuid4().bytes
+        waited = False
+        while True:
+            taken = self._call("add", lease, owner, lease_seconds)
+            if taken or taken is None:
+                break
+            # Another worker is computing it. Only reads until its lease is
+            # released or could have run out: on SQLite every add is a write
+            # transaction.
+            waited = True
+            retry_at = time.monotonic() + lease_seconds
+            while time.monotonic() < retry_at:
+                time.sleep(POLL_INTERVAL)
+                found = self._load(key)
+                if found:
+                    self._count("waits")
+                    return found[0]
+                if self._call("get", lease) is None:
+                    break
+        try:
+            if waited:
+                # The lease expired or was released without a result
+                found = self._load(key)
+                if found:
+                    return found[0]
+            value = compute()
+            self._store(key, value, ttl)
+            return value
+        finally:
+            if taken:
+                # Only our own lease: it may have expired and been taken over
+                self._call("delete_if", lease, owner)
+
+    def stats(self):
+        """Hit/miss counters and backend occupancy, for the admin panel."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "waits": self.waits,
+                "errors": self.errors,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+        if self.backend is not None:
+            stats.update(self._call("usage") or {})
+        return stats
+
+
+results = SharedCache(backend_from_url(CACHE_URL))
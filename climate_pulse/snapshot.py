@@ -0,0 +1,336 @@
+"""Static HTML snapshot of the dashboard's default views.
+
+Most visitors only look at what each tab shows before they touch a widget.
+This renders those views once: the temperature and sea level charts, the
+default USA/China/India comparison, and "Business as usual" to 2050. They
+are written as plain HTML pages with the Plotly figures embedded as JSON,
+plus a local copy of plotly.js. Any static file server or CDN can serve the
+bundle with no Python involved, and a link-share spike never reaches a
+Streamlit worker.
+
+The views are produced by running app.py headless (Streamlit's AppTest), so
+they are exactly what the live app shows. Each figure is taken from
+``show_chart``. Streamlit's own Plotly template only holds placeholder
+colours that its frontend fills in, so snapshot figures are built with
+Plotly's default template instead. The text comes from the rendered elements.
+Widgets are left out.
+
+A snapshot records the data versions it was built from in
+``snapshot.json``, along with a hash of the app's code and the Plotly
+version. Running the export again does nothing until one of them changes (new
+data or a deploy), so it is cheap to run from cron or after every ingest:
+
+    python -m climate_pulse.snapshot [output_dir] [--force] [--app-url URL]
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+import tempfile
+import textwrap
+import time
+
+from streamlit.testing.v1 import AppTest
+
+from climate_pulse import data, sharedcache, store
+from climate_pulse.pages import PAGES, common
+from climate_pulse.regions import REGIONS_FILENAME, VULNERABILITY_FILENAME
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+DEFAULT_OUTPUT_DIR = "snapshot"
+MANIFEST_NAME = "snapshot.json"
+PLOTLY_JS_NAME = "plotly.min.js"
+
+# page module -> (file name, widget changes from the page's initial state)
+VIEWS = {
+    "temperature": ("index.html", []),
+    "emissions": ("emissions.html", [("checkbox", "Compare countries", True)]),
+    "sea_level": ("sea_level.html", []),
+    "scenarios": ("scenarios.html", []),
+}
+
+_SKIPPED = {
+    "button", "checkbox", "color_picker", "date_input", "multiselect", "number_input", "radio",
+    "select_slider", "selectbox", "slider", "text_area", "text_input", "time_input", "toggle",
+}
+
+
+def _file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()[:16]
+
+
+def data_versions():
+    """Versions of every input a snapshot depends on."""
+    versions = {name: data.table_version(name) for name in store.DATASETS}
+    for filename in (REGIONS_FILENAME, VULNERABILITY_FILENAME):
+        path = os.path.join(data.DATA_DIR, filename)
+        if os.path.exists(path):
+            versions[filename] = _file_hash(path)
+    return versions
+
+
+def code_version():
+    """Version of the code that renders the views: the package, app.py and Plotly."""
+    import plotly
+
+    return f"{sharedcache._code_version()}-{_file_hash(APP_PATH)}-plotly{plotly.__version__}"
+
+
+def _read_manifest(output_dir):
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _inline(text):
+    text = html.escape(text)
+    text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
+    text = re.sub(r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*", r"<em>\1</em>", text)
+    return re.sub(r"\[([^\]]+)\]\(([^)\s]+)\)", r'<a href="\2">\1</a>', text)
+
+
+def markdown_html(text):
+    """HTML for the Markdown subset the pages use.
+
+    Covers headings, bullet and numbered lists, block quotes, paragraphs,
+    bold, italics and links.
+    """
+    out, paragraph, list_tag = [], [], None
+
+    def close():
+        nonlocal list_tag
+        if paragraph:
+            out.append(f"<p>{_inline(' '.join(paragraph))}</p>")
+            paragraph.clear()
+        if list_tag:
+            out.append(f"</{list_tag}>")
+            list_tag = None
+
+    for line in textwrap.dedent(text).strip().splitlines():
+        line = line.strip()
+        heading = re.match(r"(#{1,6})\s+(.*)", line)
+        item = re.match(r"([-*]|\d+\.)\s+(.*)", line)
+        if not line:
+            close()
+        elif heading:
+            close()
+            level = len(heading.group(1))
+            out.append(f"<h{level}>{_inline(heading.group(2))}</h{level}>")
+        elif item:
+            tag = "ol" if item.group(1)[0].isdigit() else "ul"
+            if paragraph or list_tag != tag:
+                close()
+                out.append(f"<{tag}>")
+                list_tag = tag
+            out.append(f"<li>{_inline(item.group(2))}</li>")
+        elif line.startswith(">"):
+            close()
+            out.append(f"<blockquote>{_inline(line.lstrip('> '))}</blockquote>")
+        else:
+            if list_tag:
+                close()
+            paragraph.append(line)
+    close()
+    return "\n".join(out)
+
+
+class _Renderer:
+    def __init__(self, figures):
+        self.figures = list(figures)
+        self.used = 0
+
+    def figure(self):
+        if self.used >= len(self.figures):
+            raise RuntimeError("the page drew more charts than show_chart captured")
+        fig = self.figures[self.used]
+        self.used += 1
+        spec = fig.to_json().replace("</", "<\\/")
+        return f'<div class="chart"><script type="application/json">{spec}</script></div>'
+
+    def node(self, node):
+        kind = getattr(node, "type", None)
+        if kind in _SKIPPED:
+            return ""
+        if kind == "plotly_chart":
+            return self.figure()
+        if kind == "title":
+            return f"<h1>{_inline(node.value)}</h1>"
+        if kind == "header":
+            return f"<h2>{_inline(node.value)}</h2>"
+        if kind == "subheader":
+            return f"<h3>{_inline(node.value)}</h3>"
+        if kind == "markdown":
+            return markdown_html(node.value)
+        if kind == "caption":
+            return f'<p class="caption">{_inline(node.value)}</p>'
+        if kind in ("info", "success", "warning", "error"):
+            return f'<div class="alert {kind}">{markdown_html(node.value)}</div>'
+        if kind == "metric":
+            delta = f'<div class="delta">{_inline(node.delta)}</div>' if node.delta else ""
+            return (f'<div class="metric"><div class="label">{_inline(node.label)}</div>'
+                    f'<div class="value">{_inline(node.value)}</div>{delta}</div>')
+        if kind == "tab":
+            return f'<section class="tab"><h4>{_inline(node.label)}</h4>{self.children(node)}</section>'
+        return self.children(node)
+
+    def children(self, node):
+        parts, row = [], []
+        for child in getattr(node, "children", {}).values():
+            if getattr(child, "type", None) == "column":
+                row.append(f'<div class="column">{self.children(child)}</div>')
+                continue
+            if row:
+                parts.append(f'<div class="row">{"".join(row)}</div>')
+                row = []
+            parts.append(self.node(child))
+        if row:
+            parts.append(f'<div class="row">{"".join(row)}</div>')
+        return "\n".join(part for part in parts if part)
+
+
+_STYLE = """
+body { font-family: "Source Sans Pro", system-ui, sans-serif; max-width: 1100px; margin: 0 auto; padding: 1rem 2rem; color: #31333f; }
+nav { display: flex; flex-wrap: wrap; gap: .25rem 1.5rem; border-bottom: 1px solid #e6e6e6; padding-bottom: .5rem; margin-bottom: 1rem; }
+nav a { color: inherit; text-decoration: none; }
+nav a.open { color: #ff4b4b; border-bottom: 2px solid #ff4b4b; }
+.row { display: flex; gap: 1rem; }
+.column { flex: 1; min-width: 0; }
+.chart { min-height: 450px; }
+.metric .label { font-size: .875rem; }
+.metric .value { font-size: 2.25rem; }
+.alert { padding: .75rem 1rem; border-radius: .5rem; margin: 1rem 0; }
+.info { background: #e8f0fe; } .success { background: #e6f4ea; } .warning { background: #fef7e0; } .error { background: #fce8e6; }
+blockquote { border-left: 3px solid #e6e6e6; margin-left: 0; padding-left: 1rem; }
+.caption, footer { color: #808495; font-size: .875rem; }
+"""
+
+_SCRIPT = """
+for (const chart of document.querySelectorAll(".chart")) {
+  const figure = JSON.parse(chart.querySelector("script").textContent);
+  Plotly.newPlot(chart, figure.data, figure.layout, {responsive: true});
+}
+"""
+
+
+def _page_html(title, nav, body, footer):
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(title)}</title>
+<style>{_STYLE}</style>
+<script src="{PLOTLY_JS_NAME}"></script>
+</head>
+<body>
+{nav}
+{body}
+<footer>{footer}</footer>
+<script>{_SCRIPT}</script>
+</body>
+</html>
+"""
+
+
+def render_view(page, steps):
+    """Body HTML of one page's default view."""
+    at = AppTest.from_file(APP_PATH, default_timeout=600)
+    at.session_state["page"] = page.label
+    try:
+        common.captured_figures = []
+        at.run()
+        for kind, label, value in steps:
+            next(w for w in getattr(at, kind) if w.label == label).set_value(value)
+            # Only the last run's figures are on screen
+            common.captured_figures = []
+            at.run()
+        if at.exception:
+            raise RuntimeError(f"{page.label}: {at.exception[0].message}")
+        figures = common.captured_figures
+    finally:
+        common.captured_figures = None
+
+    # Keep the app header, then only the open tab's content
+    renderer = _Renderer(figures)
+    parts = []
+    for node in at.main.children.values():
+        if getattr(node, "type", None) in ("title", "markdown"):
+            parts.append(renderer.node(node))
+        else:
+            parts.extend(renderer.children(tab) for tab in node.children.values() if tab.children)
+    if renderer.used != len(figures):
+        raise RuntimeError(f"{page.label}: drew {len(figures)} charts but only {renderer.used} were placed")
+    return "\n".join(parts)
+
+
+def _write(path, text):
+    # Readers never see a half-written file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+
+
+def export(output_dir=DEFAULT_OUTPUT_DIR, force=False, app_url=None):
+    """Write the snapshot unless it is already current; returns True if written."""
+    versions, code = data_versions(), code_version()
+    manifest = _read_manifest(output_dir)
+    if (not force and manifest is not None and manifest["versions"] == versions
+            and manifest.get("code") == code):
+        return False
+
+    import plotly.io
+    import plotly.offline
+
+    os.makedirs(output_dir, exist_ok=True)
+    # Rewritten with every build, so it always matches the figures' Plotly
+    _write(os.path.join(output_dir, PLOTLY_JS_NAME), plotly.offline.get_plotlyjs())
+
+    pages = {page.module: page for page in PAGES}
+    generated = time.strftime("%Y-%m-%d %H:%M %Z")
+    footer = f"Snapshot generated {generated}. "
+    if app_url:
+        footer += f'<a href="{html.escape(app_url)}">Open the interactive dashboard</a>.'
+    theme, plotly.io.templates.default = plotly.io.templates.default, "plotly"
+    try:
+        for module, (filename, steps) in VIEWS.items():
+            links = []
+            for other, (name, _) in VIEWS.items():
+                opened = ' class="open"' if name == filename else ""
+                links.append(f'<a href="{name}"{opened}>{html.escape(pages[other].label)}</a>')
+            nav = f"<nav>{''.join(links)}</nav>"
+            body = render_view(pages[module], steps)
+            _write(os.path.join(output_dir, filename), _page_html("Climate Pulse", nav, body, footer))
+    finally:
+        plotly.io.templates.default = theme
+
+    # The manifest goes last, so an interrupted export is redone next time
+    _write(os.path.join(output_dir, MANIFEST_NAME),
+           json.dumps({"versions": versions, "code": code, "generated": generated, "views": list(VIEWS)},
+                      indent=2))
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the default dashboard views as static HTML.")
+    parser.add_argument("output_dir", nargs="?", default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument("--force", action="store_true", help="rebuild even if the data and code have not changed")
+    parser.add_argument("--app-url", help="link to the live dashboard, shown on every page")
+    args = parser.parse_args(argv)
+
+    if export(args.output_dir, args.force, args.app_url):
+        print(f"Snapshot written to {args.output_dir}", file=sys.stderr)
+    else:
+        print(f"Snapshot in {args.output_dir} is up to date", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""Columnar, memory-mapped copies of the CSV datasets in ``data/``.
+
+Each CSV is converted once into one ``.npy`` file per column under
+``data/.store/<dataset>/<build>/``. String columns (``Country``) are
+dictionary-encoded: the codes are stored as a small integer array and the
+categories in the build manifest. Rows are stored sorted by the dataset's
+``SORT_KEYS``, so the emissions index can slice the mapped CO₂ table by
+country as it is, without a sorted copy per worker. Loading maps the arrays
+with ``np.load(mmap_mode="r")`` and wraps them in a DataFrame without copying, so
+every Streamlit worker on a host shares the same page-cache pages instead of
+parsing its own copy of the CSV.
+
+A build is keyed on the source file's size and mtime. When a source changes
+only that dataset is rebuilt; the new build is written to a fresh directory
+and published by atomically replacing ``current.json``, so workers that still
+map the previous build are never affected. Conversions hold a file lock on
+the dataset's directory, so workers starting together convert once between
+them. Every build other than the published one is then removed, except one
+still being written.
+
+Convert ahead of time (e.g. during a deploy) with::
+
+    python -m climate_pulse.store [data_dir]
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows: conversions are not coordinated across processes
+    fcntl = None
+
+DATASETS = {
+    "co2": "co2_emissions.csv",
+    "temp": "temperature.csv",
+    "sea": "sea_level.csv",
+}
+
+# Columns each dataset's rows are sorted by when converted
+SORT_KEYS = {"co2": ["Country", "Year"]}
+
+STORE_DIRNAME = ".store"
+MANIFEST_NAME = "current.json"
+LOCK_NAME = ".lock"
+ABANDONED_BUILD_SECONDS = 3600  # an unfinished build this old was abandoned
+FORMAT = 2  # bumped when builds change shape; older builds are reconverted
+
+# (data_dir, name) -> (version, DataFrame) for the tables this process has mapped
+_mapped = {}
+# One lock per (data_dir, name), so datasets convert and map in parallel
+_locks = defaultdict(threading.Lock)
+_locks_lock = threading.Lock()
+
+
+def source_version(data_dir, name):
+    """Version token for a source CSV, derived from its size and mtime."""
+    stat = os.stat(os.path.join(data_dir, DATASETS[name]))
+    key = f"{DATASETS[name]}:{stat.st_size}:{stat.st_mtime_ns}"
+    return hashlib.sha1(key.encode()).hexdigest()[:16]
+
+
+def _dataset_dir(data_dir, name):
+    return os.path.join(data_dir, STORE_DIRNAME, name)
+
+
+def _read_manifest(data_dir, name):
+    try:
+        with open(os.path.join(_dataset_dir(data_dir, name), MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+@contextmanager
+def _conversion_lock(dataset_dir):
+    # Held across processes while a dataset is checked, converted and mapped
+    os.makedirs(dataset_dir, exist_ok=True)
+    if fcntl is None:
+        yield
+        return
+    with open(os.path.join(dataset_dir, LOCK_NAME), "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def convert(data_dir, name):
+    """Convert one source CSV into a new columnar build and publish it."""
+    with _conversion_lock(_dataset_dir(data_dir, name)):
+        return _convert(data_dir, name)
+
+
+def _convert(data_dir, name):
+    version = source_version(data_dir, name)
+    df = pd.read_csv(os.path.join(data_dir, DATASETS[name]))
+
+    # Written under a dot name, and renamed once complete
+    dataset_dir = _dataset_dir(data_dir, name)
+    partial_dir = tempfile.mkdtemp(prefix=f".{version}-", dir=dataset_dir)
+
+    columns, arrays = [], {}
+    for column in df.columns:
+        values = df[column]
+        entry = {"name": column, "file": f"{len(columns)}.npy"}
+        if values.dtype.kind in "biuf":
+            arrays[column] = values.to_numpy()
+        else:
+            # Categories come out sorted, so sorting the codes sorts the strings
+            categorical = pd.Categorical(values)
+            arrays[column] = categorical.codes
+            entry["categories"] = [str(c) for c in categorical.categories]
+        columns.append(entry)
+
+    sort_keys = SORT_KEYS.get(name, [])
+    order = np.lexsort([arrays[key] for key in reversed(sort_keys)]) if sort_keys else None
+    for entry in columns:
+        array = arrays[entry["name"]]
+        if order is not None:
+            array = array[order]
+        np.save(os.path.join(partial_dir, entry["file"]), array, allow_pickle=False)
+    build_dir = os.path.join(dataset_dir, os.path.basename(partial_dir)[1:])
+    os.rename(partial_dir, build_dir)
+
+    manifest = {
+        "format": FORMAT,
+        "version": version,
+        "build": os.path.basename(build_dir),
+        "rows": len(df),
+        "sorted_by": sort_keys,
+        "columns": columns,
+    }
+    fd, tmp_path = tempfile.mkstemp(suffix=".json", dir=dataset_dir)
+    with os.fdopen(fd, "w") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, os.path.join(dataset_dir, MANIFEST_NAME))
+
+    _remove_stale_builds(dataset_dir, manifest["build"])
+    return manifest
+
+
+def _remove_stale_builds(dataset_dir, current):
+    # Everything but the published build goes, including copies left by
+    # older formats or by crashed conversions. A partial build is kept while
+    # it may still be written (only possible without the lock). Unlinking
+    # files another worker still maps is safe on POSIX; on Windows the
+    # removal just fails and is retried after the next conversion.
+    now = time.time()
+    for entry in os.scandir(dataset_dir):
+        if not entry.is_dir() or entry.name == current:
+            continue
+        if entry.name.startswith(".") and now - entry.stat().st_mtime < ABANDONED_BUILD_SECONDS:
+            continue
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def _map(data_dir, name, manifest):
+    build_dir = os.path.join(_dataset_dir(data_dir, name), manifest["build"])
+    data = {}
+    for entry in manifest["columns"]:
+        array = np.load(os.path.join(build_dir, entry["file"]), mmap_mode="r")
+        if "categories" in entry:
+            array = pd.Categorical.from_codes(array, categories=entry["categories"], validate=False)
+        data[entry["name"]] = array
+    return pd.DataFrame(data, copy=False)
+
+
+def load_table(data_dir, name):
+    """Return the memory-mapped DataFrame for a dataset, rebuilding it if stale."""
+    version = source_version(data_dir, name)
+    with _locks_lock:
+        lock = _locks[data_dir, name]
+    with lock:
+        cached = _mapped.get((data_dir, name))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        # Mapped under the lock too, so no other worker's cleanup removes the
+        # build between reading the manifest and mapping its files
+        with _conversion_lock(_dataset_dir(data_dir, name)):
+            manifest = _read_manifest(data_dir, name)
+            if manifest is None or manifest["version"] != version or manifest.get("format") != FORMAT:
+                manifest = _convert(data_dir, name)
+            df = _map(data_dir, name, manifest)
+        _mapped[(data_dir, name)] = (version, df)
+        return df
+
+
+def concat_tables(frames):
+    """Concatenate tables, keeping dictionary-encoded columns categorical.
+
+    Categorical columns are recoded onto the union of the categories in
+    ``frames``; plain ``pd.concat`` would fall back to object columns.
+    """
+    frames = list(frames)
+    dtypes = {}
+    for column, dtype in frames[0].dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            categories = set()
+            for frame in frames:
+                values = frame[column]
+                if isinstance(values.dtype, pd.CategoricalDtype):
+                    categories.update(values.cat.categories)
+                else:
+                    categories.update(values.dropna().unique())
+            dtypes[column] = pd.CategoricalDtype(sorted(categories))
+    return pd.concat([frame.astype(dtypes) for frame in frames], ignore_index=True)
+
+
+def load_tables(data_dir):
+    """Return ``(co2_df, temp_df, sea_df)`` backed by the columnar store."""
+    return tuple(load_table(data_dir, name) for name in DATASETS)
+
+
+if __name__ == "__main__":
+    data_dir = sys.argv[1] if len(sys.argv) > 1 else "data"
+    for name in DATASETS:
+        manifest = convert(data_dir, name)
+        print(f"{name}: {manifest['rows']} rows -> {manifest['build']}")
@@ -0,0 +1,218 @@
+"""Per-country emissions trend lines.
+
+Least-squares fits for every country come from one batched pass: grouped
+sufficient statistics (n, Σx, Σy, Σx², Σxy, Σy²) are accumulated per country
+with ``np.bincount``. Slope, intercept, fit error and R² then follow in closed
+form, for all countries at once. The statistics are sums, so ``extend`` folds
+appended years in by adding the new rows' sums, without revisiting old rows.
+
+Two robust alternatives are fitted per country, on demand, from the
+country's rows, and are cached until the data changes:
+
+- Theil–Sen: the median of the slopes between pairs of points. It ignores
+  outliers. Long series use a fixed random sample of ``MAX_PAIRS`` pairs.
+- Piecewise: two least-squares segments split at the breakpoint year that
+  minimises the total squared error. Every candidate split is scored at once
+  from prefix sums of the same statistics.
+"""
+
+import threading
+from typing import NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+METHODS = {"ols": "Least squares", "theil_sen": "Theil–Sen", "piecewise": "Piecewise (breakpoint)"}
+MAX_PAIRS = 200_000  # Theil–Sen pairs sampled per country
+MIN_SEGMENT = 3  # points on each side of a piecewise breakpoint
+REFERENCE_YEAR = 2000  # years are centred on this for numerical stability
+
+_STATS = ["n", "x", "y", "xx", "xy", "yy"]
+
+
+class Trend(NamedTuple):
+    method: str
+    slope: float  # per year; for piecewise fits, of the segment after the breakpoint
+    intercept: float  # value at year 0 of the line with ``slope``
+    rmse: float  # root mean squared residual of the fit
+    breakpoint: Optional[float] = None  # first year of the second segment
+    slope_before: Optional[float] = None
+    intercept_before: Optional[float] = None
+
+    def predict(self, years):
+        years = np.asarray(years, dtype=float)
+        values = self.intercept + self.slope * years
+        if self.breakpoint is not None:
+            before = self.intercept_before + self.slope_before * years
+            values = np.where(years < self.breakpoint, before, values)
+        return values
+
+
+def _sums(x, y, codes, size):
+    """Per-code sufficient statistics, one row per code, columns as ``_STATS``."""
+    x = x - REFERENCE_YEAR
+    weights = [None, x, y, x * x, x * y, y * y]
+    return np.column_stack([np.bincount(codes, weights=w, minlength=size) for w in weights])
+
+
+def _least_squares(sums):
+    """Slope, centred intercept and SSE for each row of sufficient statistics."""
+    n, sx, sy, sxx, sxy, syy = (sums[..., i] for i in range(len(_STATS)))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cxx = sxx - sx * sx / n
+        cxy = sxy - sx * sy / n
+        cyy = syy - sy * sy / n
+        slope = np.where(cxx > 0, cxy / cxx, 0.0)
+        intercept = (sy - slope * sx) / n
+        sse = np.maximum(cyy - slope * cxy, 0.0)
+    return slope, intercept, sse, cyy
+
+
+def _rmse(sse, n):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.sqrt(np.where(n > 2, sse / (n - 2), 0.0))
+
+
+class TrendEngine:
+    def __init__(self, co2_df):
+        codes, countries = pd.factorize(co2_df["Country"], sort=True)
+        self.countries = [str(c) for c in countries]
+        self._sums = _sums(
+            co2_df["Year"].to_numpy(dtype=float),
+            co2_df["Emissions"].to_numpy(dtype=float),
+            codes,
+            len(self.countries),
+        )
+        self._fits = {}  # (country, method) -> Trend
+        self._lock = threading.Lock()
+        self._summarize()
+
+    def _summarize(self):
+        self._positions = {country: i for i, country in enumerate(self.countries)}
+        slope, intercept, sse, cyy = _least_squares(self._sums)
+        n = self._sums[:, 0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r2 = np.where(cyy > 0, 1 - sse / cyy, np.nan)
+        self.summary = pd.DataFrame(
+            {
+                "Points": n.astype(int),
+                "Slope": slope,
+                "Intercept": intercept - slope * REFERENCE_YEAR,
+                "RMSE": _rmse(sse, n),
+                "R2": r2,
+            },
+            index=pd.Index(self.countries, name="Country"),
+        )
+
+    def __contains__(self, country):
+        return country in self._positions
+
+    def __getstate__(self):
+        # Pickled for the shared result cache; the lock stays behind
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def extend(self, rows):
+        """A new engine with ``rows`` folded into the statistics.
+
+        Cached robust fits are kept for the countries ``rows`` doesn't touch.
+        """
+        codes, touched = pd.factorize(rows["Country"], sort=True)
+        touched = [str(c) for c in touched]
+        delta = _sums(rows["Year"].to_numpy(dtype=float), rows["Emissions"].to_numpy(dtype=float),
+                      codes, len(touched))
+
+        engine = object.__new__(TrendEngine)
+        engine.countries = sorted(set(self.countries) | set(touched))
+        positions = {country: i for i, country in enumerate(engine.countries)}
+        engine._sums = np.zeros((len(engine.countries), len(_STATS)))
+        engine._sums[[positions[c] for c in self.countries]] += self._sums
+        engine._sums[[positions[c] for c in touched]] += delta
+        untouched = set(self.countries) - set(touched)
+        engine._fits = {key: fit for key, fit in self._fits.items() if key[0] in untouched}
+        engine._lock = threading.Lock()
+        engine._summarize()
+        return engine
+
+    def ols(self, country):
+        row = self.summary.loc[country]
+        return Trend("ols", float(row["Slope"]), float(row["Intercept"]), float(row["RMSE"]))
+
+    def fit(self, country, method, country_data):
+        """The ``method`` fit for one country, from its rows ordered by year.
+
+        ``country_data`` is only read on the first call per country and
+        method; least-squares fits never need it.
+        """
+        if method == "ols":
+            return self.ols(country)
+        key = (country, method)
+        with self._lock:
+            fit = self._fits.get(key)
+        if fit is None:
+            years = country_data["Year"].to_numpy(dtype=float)
+            emissions = country_data["Emissions"].to_numpy(dtype=float)
+            if method == "theil_sen":
+                fit = _theil_sen(years, emissions)
+            elif method == "piecewise":
+                fit = _piecewise(years, emissions)
+            else:
+                raise ValueError(f"unknown trend method {method!r}; expected one of {', '.join(METHODS)}")
+            with self._lock:
+                self._fits[key] = fit
+        return fit
+
+
+def _theil_sen(years, emissions):
+    n = len(years)
+    if n < 2:
+        return Trend("theil_sen", 0.0, float(emissions.mean()) if n else 0.0, 0.0)
+    if n * (n - 1) // 2 <= MAX_PAIRS:
+        i, j = np.triu_indices(n, k=1)
+    else:
+        rng = np.random.default_rng(0)
+        i, j = rng.integers(0, n, (2, MAX_PAIRS))
+    dx = years[j] - years[i]
+    valid = dx != 0
+    slope = float(np.median((emissions[j] - emissions[i])[valid] / dx[valid])) if valid.any() else 0.0
+    intercept = float(np.median(emissions - slope * years))
+    residuals = emissions - (intercept + slope * years)
+    return Trend("theil_sen", slope, intercept, float(np.sqrt(np.mean(residuals ** 2))))
+
+
+def _piecewise(years, emissions):
+    n = len(years)
+    if n < 2 * MIN_SEGMENT:
+        codes = np.zeros(n, dtype=np.int64)
+        slope, intercept, sse, _ = _least_squares(_sums(years, emissions, codes, 1)[0])
+        return Trend("piecewise", float(slope), float(intercept - slope * REFERENCE_YEAR),
+                     float(_rmse(sse, n)))
+
+    # Statistics of the first k points for every k; the rest is total minus those
+    x = years - REFERENCE_YEAR
+    running = np.cumsum(np.column_stack([np.ones(n), x, emissions, x * x, x * emissions,
+                                         emissions * emissions]), axis=0)
+    splits = np.arange(MIN_SEGMENT, n - MIN_SEGMENT + 1)
+    before = running[splits - 1]
+    after = running[-1] - before
+    _, _, sse_before, _ = _least_squares(before)
+    _, _, sse_after, _ = _least_squares(after)
+    best = int(np.argmin(sse_before + sse_after))
+
+    slope_before, intercept_before, _, _ = _least_squares(before[best])
+    slope, intercept, _, _ = _least_squares(after[best])
+    rmse = np.sqrt((sse_before[best] + sse_after[best]) / max(n - 4, 1))
+    return Trend(
+        "piecewise",
+        float(slope),
+        float(intercept - slope * REFERENCE_YEAR),
+        float(rmse),
+        breakpoint=float(years[splits[best]]),
+        slope_before=float(slope_before),
+        intercept_before=float(intercept_before - slope_before * REFERENCE_YEAR),
+    )